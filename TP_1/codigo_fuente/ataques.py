@@ -0,0 +1,195 @@
+"""Órdenes de ataque: estático (centralidad inicial) y adaptativo (recalculada tras cada remoción)."""
+import heapq
+
+import networkx as nx
+
+from centralidades import (autovector_disperso, cercania_bitparalela, intermediacion_aproximada,
+                           intermediacion_paralela, pagerank_disperso)
+
+
+# -------------------------------
+# Centralidades de los ataques
+# -------------------------------
+CENTRALIDADES = {
+    'grado': nx.degree_centrality,
+    'cercania': cercania_bitparalela,
+    'intermediacion': intermediacion_paralela,
+    'intermediacion_aproximada': intermediacion_aproximada,
+    'eigenvector': autovector_disperso,
+    'pagerank': pagerank_disperso,
+}
+
+# Parámetros con que los scripts calculan cada centralidad
+PARAMETROS = {
+    'eigenvector': {'max_iter': 1000},
+    'pagerank': {'max_iter': 1000},
+}
+
+def parametros_de(medida, **parametros):
+    '''Parámetros por defecto de la medida, pisados por los que se pasen.'''
+    if medida not in CENTRALIDADES:
+        raise ValueError(f"medida debe ser una de {sorted(CENTRALIDADES)}, no {medida!r}")
+    return {**PARAMETROS.get(medida, {}), **parametros}
+
+def calcular_centralidad(G, medida, **parametros):
+    return CENTRALIDADES[medida](G, **parametros_de(medida, **parametros))
+
+
+# -------------------------------
+# Ataque estático
+# -------------------------------
+def estrategia_tradicional(G, centralidad_dict):
+    return [n for n, _ in sorted(centralidad_dict.items(), key=lambda x: x[1], reverse=True)]
+
+
+# -------------------------------
+# Ataques adaptativos
+# -------------------------------
+def _adaptativo_grado(G):
+    '''Max-heap perezoso: las entradas viejas se descartan al salir del heap.
+
+    Los empates se resuelven por la posición del nodo en G, igual que
+    estrategia_tradicional sobre dict(G.degree()).
+    '''
+    grado = dict(G.degree())
+    posicion = {nodo: i for i, nodo in enumerate(grado)}
+    heap = [(-g, posicion[nodo], nodo) for nodo, g in grado.items()]
+    heapq.heapify(heap)
+    orden = []
+    while heap:
+        g, _, nodo = heapq.heappop(heap)
+        if nodo not in grado or -g != grado[nodo]:
+            continue
+        orden.append(nodo)
+        del grado[nodo]
+        for vecino in G[nodo]:
+            if vecino in grado:
+                grado[vecino] -= 1
+                heapq.heappush(heap, (-grado[vecino], posicion[vecino], vecino))
+    return orden
+
+def _espectral(H, medida, previo, max_iter=1000, tol=1.0e-6):
+    if previo is not None:
+        previo = {n: previo.get(n, 0) for n in H}
+        if sum(previo.values()) <= 0:
+            previo = None
+    try:
+        if medida == 'pagerank':
+            return pagerank_disperso(H, inicial=previo, max_iter=max_iter, tol=tol)
+        return autovector_disperso(H, inicial=previo, max_iter=max_iter, tol=tol)
+    except nx.PowerIterationFailedConvergence:
+        # Se sigue con el vector anterior (ya restringido a los nodos de H)
+        return previo or dict(H.degree())
+
+def _adaptativo_espectral(G, medida, inicial=None, max_iter=1000):
+    '''PageRank o eigenvector recalculados con arranque en caliente.
+
+    Después de sacar un nodo el vector anterior ya está cerca del nuevo, así
+    que la iteración de potencias (o ARPACK) converge en pocas vueltas.
+    '''
+    H = G.copy()
+    if inicial is not None:
+        valores = dict(inicial)
+    else:
+        valores = _espectral(H, medida, None, max_iter)
+    orden = []
+    while H.number_of_edges() > 0:
+        nodo = max(valores, key=valores.get)
+        orden.append(nodo)
+        H.remove_node(nodo)
+        del valores[nodo]
+        if H.number_of_edges() > 0:
+            valores = _espectral(H, medida, valores, max_iter)
+    # Sin aristas el orden del resto no cambia las curvas
+    return orden + sorted(H, key=lambda n: valores.get(n, 0), reverse=True)
+
+def _medida_por_componente(H, nodos, medida, k=None, semilla=None):
+    '''Medida de los nodos de una componente, comparable entre componentes.
+
+    - intermediación: sin normalizar, que dentro de la componente coincide
+      con la del grafo completo (k > 0 usa muestreo de k fuentes).
+    - cercanía: r² / suma de distancias, la cercanía de Wasserman-Faust
+      multiplicada por el factor (N - 1) común a todos los nodos.
+    '''
+    sub = H.subgraph(nodos).copy()
+    if medida == 'intermediacion':
+        kk = min(k, len(sub)) if k else None
+        return nx.betweenness_centrality(sub, k=kk, normalized=False, seed=semilla)
+    r = len(sub) - 1
+    cercania = nx.closeness_centrality(sub, wf_improved=False)
+    return {n: c * r for n, c in cercania.items()}
+
+def _adaptativo_por_componente(G, medida, k=None, semilla=None):
+    '''Intermediación o cercanía recalculadas solo en la componente afectada.
+
+    Ambas medidas dependen únicamente de la componente conexa del nodo, así
+    que al eliminar v solo se recalculan las componentes en que se parte la
+    componente de v; el resto de los valores se conserva.
+    '''
+    H = G.copy()
+    valores = {}
+    for componente in nx.connected_components(H):
+        valores.update(_medida_por_componente(H, componente, medida, k, semilla))
+    orden = []
+    while H.number_of_edges() > 0:
+        nodo = max(valores, key=valores.get)
+        orden.append(nodo)
+        vecinos = list(H[nodo])
+        H.remove_node(nodo)
+        del valores[nodo]
+        vistos = set()
+        for vecino in vecinos:
+            if vecino in vistos:
+                continue
+            componente = nx.node_connected_component(H, vecino)
+            vistos |= componente
+            valores.update(_medida_por_componente(H, componente, medida, k, semilla))
+    return orden + sorted(H, key=valores.get, reverse=True)
+
+ADAPTATIVOS = ('grado', 'pagerank', 'eigenvector', 'intermediacion', 'cercania')
+
+# Fuentes de la intermediación muestreada cuando el ataque adaptativo usa
+# intermediacion_aproximada (las mismas con que arranca intermediacion_aproximada)
+MUESTRAS_ADAPTATIVAS = 64
+
+@nx.utils.not_implemented_for("directed")
+def estrategia_adaptativa(G, medida, inicial=None, k=None, semilla=None, max_iter=1000):
+    '''Ataque recalculado: saca el nodo más central, recalcula y repite.
+
+    Cada medida usa la actualización más barata que admite:
+
+    - grado: max-heap perezoso, O(M log N) en total.
+    - pagerank / eigenvector: iteración de potencias arrancando del vector
+      del paso anterior (`inicial` es el vector del grafo completo, si ya
+      se calculó).
+    - intermediacion / cercania: solo se recalcula la componente del nodo
+      eliminado; con k se usa intermediación muestreada con k fuentes.
+
+    Devuelve el orden de todos los nodos, listo para simular_robustez.
+    '''
+    if medida not in ADAPTATIVOS:
+        raise ValueError(f"medida debe ser una de {ADAPTATIVOS}, no {medida!r}")
+    if medida == 'grado':
+        return _adaptativo_grado(G)
+    if medida in ('pagerank', 'eigenvector'):
+        return _adaptativo_espectral(G, medida, inicial, max_iter)
+    return _adaptativo_por_componente(G, medida, k, semilla)
+
+def ordenar_nodos(G, centralidad_dict, medida, modo='estatico', **opciones):
+    '''Orden de ataque estático (estrategia_tradicional) o adaptativo.
+
+    En modo adaptativo 'intermediacion_aproximada' es la intermediación por
+    componente con k = MUESTRAS_ADAPTATIVAS fuentes al azar.
+    '''
+    if modo == 'estatico':
+        return estrategia_tradicional(G, centralidad_dict)
+    if modo == 'adaptativo':
+        if medida == 'intermediacion_aproximada':
+            # Recalcular por componente con k fuentes al azar
+            medida = 'intermediacion'
+            opciones.setdefault('k', MUESTRAS_ADAPTATIVAS)
+            opciones.setdefault('semilla', 0)
+        if medida in ('pagerank', 'eigenvector'):
+            opciones.setdefault('inicial', centralidad_dict)
+        return estrategia_adaptativa(G, medida, **opciones)
+    raise ValueError(f"modo debe ser 'estatico' o 'adaptativo', no {modo!r}")
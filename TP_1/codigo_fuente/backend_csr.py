@@ -0,0 +1,99 @@
+"""Backend CSR (scipy.sparse) para Ng/N y eficiencia global con remoción por máscara."""
+import networkx as nx
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+
+
+class GrafoCSR:
+    '''Grafo no dirigido como matriz de adyacencia CSR más una máscara de nodos activos.
+
+    La matriz se arma una sola vez; eliminar un nodo solo apaga su entrada
+    en la máscara y las métricas se calculan sobre la submatriz de los
+    nodos activos.
+    '''
+
+    def __init__(self, nodos, A):
+        self.nodos = np.asarray(nodos)
+        self.indice = {nodo: i for i, nodo in enumerate(self.nodos.tolist())}
+        self.A = sparse.csr_matrix(A, dtype=np.int8)
+        self.activo = np.ones(len(self.nodos), dtype=bool)
+        self.lazos = self.A.diagonal() > 0
+        self.aristas = (self.A.nnz - int(self.lazos.sum())) // 2 + int(self.lazos.sum())
+
+    @classmethod
+    def desde_aristas(cls, array):
+        '''Arma el grafo desde el arreglo de redes.leer_aristas (se usan las dos primeras columnas).'''
+        array = np.asarray(array)
+        extremos = array[:, :2]
+        nodos, inversa = np.unique(extremos, return_inverse=True)
+        inversa = inversa.reshape(extremos.shape)
+        filas = np.concatenate([inversa[:, 0], inversa[:, 1]])
+        columnas = np.concatenate([inversa[:, 1], inversa[:, 0]])
+        n = len(nodos)
+        A = sparse.coo_matrix((np.ones(len(filas), dtype=np.int32), (filas, columnas)), shape=(n, n))
+        A = A.tocsr()
+        A.data[:] = 1  # aristas repetidas o en ambos sentidos cuentan una vez
+        return cls(nodos, A)
+
+    @classmethod
+    def desde_networkx(cls, G):
+        if nx.is_directed(G):
+            raise nx.NetworkXNotImplemented("GrafoCSR no admite grafos dirigidos")
+        nodos = list(G)
+        A = nx.to_scipy_sparse_array(G, nodelist=nodos, weight=None, format='csr')
+        A.data[:] = 1
+        return cls(nodos, A)
+
+    def __contains__(self, nodo):
+        i = self.indice.get(nodo)
+        return i is not None and self.activo[i]
+
+    # Lo mínimo de la interfaz de nx.Graph que usa percolacion.curva_ngn
+    def __iter__(self):
+        return iter(self.nodos[self.activo].tolist())
+
+    def __getitem__(self, nodo):
+        i = self.indice[nodo]
+        vecinos = self.A.indices[self.A.indptr[i]:self.A.indptr[i + 1]]
+        return self.nodos[vecinos[self.activo[vecinos]]].tolist()
+
+    def is_directed(self):
+        return False
+
+    def eliminar(self, nodo):
+        i = self.indice[nodo]
+        vecinos = self.A.indices[self.A.indptr[i]:self.A.indptr[i + 1]]
+        self.aristas -= int(self.activo[vecinos[vecinos != i]].sum()) + int(self.lazos[i])
+        self.activo[i] = False
+
+    def number_of_nodes(self):
+        return int(self.activo.sum())
+
+    def number_of_edges(self):
+        return self.aristas
+
+    def subgrafo(self):
+        '''Submatriz CSR de los nodos activos.'''
+        activos = np.flatnonzero(self.activo)
+        return self.A[activos][:, activos]
+
+    def ng_n(self):
+        n = self.number_of_nodes()
+        _, etiquetas = csgraph.connected_components(self.subgrafo(), directed=False)
+        return np.bincount(etiquetas).max() / n
+
+    def eficiencia(self, lote=256):
+        '''Eficiencia global por lotes de fuentes BFS, como nx.global_efficiency.'''
+        n = self.number_of_nodes()
+        denom = n * (n - 1)
+        if denom == 0:
+            return 0
+        sub = self.subgrafo()
+        total = 0.0
+        for inicio in range(0, n, lote):
+            fuentes = np.arange(inicio, min(inicio + lote, n))
+            D = csgraph.shortest_path(sub, method='D', directed=False, unweighted=True, indices=fuentes)
+            finitas = D[np.isfinite(D) & (D > 0)]
+            total += (1 / finitas).sum()
+        return float(total / denom)
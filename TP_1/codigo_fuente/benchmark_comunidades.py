@@ -0,0 +1,67 @@
+"""Benchmark: Louvain y Leiden contra Girvan-Newman (tiempo y mejor modularidad) en ambas redes."""
+import argparse
+import os
+import time
+
+from comunidades import girvan_newman_con_modularidad
+from louvain import louvain_con_reinicios
+from redes import CARGADORES
+
+# Uso: python benchmark_comunidades.py [--facebook facebook.txt] [--aeropuertos airport.txt]
+#                                      [--reinicios R] [--max-niveles-gn K]
+parser = argparse.ArgumentParser()
+parser.add_argument('--facebook', default='facebook.txt')
+parser.add_argument('--aeropuertos', default='airport.txt')
+parser.add_argument('--reinicios', type=int, default=8)
+parser.add_argument('--procesos', type=int, default=None)
+parser.add_argument('--max-niveles-gn', type=int, default=None,
+                    help="cortar Girvan-Newman después de K niveles (en Facebook completo tarda horas)")
+args = parser.parse_args()
+
+
+# -------------------------------
+# Métodos
+# -------------------------------
+def correr_gn(G):
+    mod_max, comunidades, niveles = -999, 0, 0
+    for niveles, (communities, n_modularidad) in enumerate(
+            girvan_newman_con_modularidad(G, procesos=args.procesos), start=1):
+        if n_modularidad > mod_max:
+            mod_max, comunidades = n_modularidad, len(communities)
+        if args.max_niveles_gn and niveles >= args.max_niveles_gn:
+            break
+    return mod_max, comunidades, niveles
+
+def correr_louvain(G, leiden):
+    _, niveles, _ = louvain_con_reinicios(G, reinicios=args.reinicios, procesos=args.procesos, leiden=leiden)
+    etiquetas, mod_max = max(niveles, key=lambda nivel: nivel[1])
+    return mod_max, len(set(etiquetas.tolist())), len(niveles)
+
+METODOS = {
+    'louvain': lambda G: correr_louvain(G, leiden=False),
+    'leiden': lambda G: correr_louvain(G, leiden=True),
+    'girvan_newman': correr_gn,
+}
+
+
+# -------------------------------
+# Comparación por red
+# -------------------------------
+filas = []
+print(f"{'red':>12} {'metodo':>14} {'tiempo':>9} {'modularidad':>11} {'comunidades':>11} {'niveles':>7}")
+for red in ('facebook', 'aeropuertos'):
+    G = CARGADORES[red](getattr(args, red))
+    for metodo, correr in METODOS.items():
+        t0 = time.perf_counter()
+        mod_max, comunidades, niveles = correr(G)
+        tiempo = time.perf_counter() - t0
+        filas.append((red, metodo, tiempo, mod_max, comunidades, niveles))
+        print(f"{red:>12} {metodo:>14} {tiempo:9.2f} {mod_max:11.4f} {comunidades:11d} {niveles:7d}")
+
+output_path = os.path.dirname(os.path.abspath(__file__))
+output_file = os.path.join(output_path, 'benchmark_comunidades.csv')
+with open(output_file, 'w') as f:
+    f.write("red,metodo,tiempo,modularidad,comunidades,niveles\n")
+    for red, metodo, tiempo, mod_max, comunidades, niveles in filas:
+        f.write(f"{red},{metodo},{tiempo:.6g},{mod_max:.6f},{comunidades},{niveles}\n")
+print(f"💾 Resultados guardados en '{output_file}'")
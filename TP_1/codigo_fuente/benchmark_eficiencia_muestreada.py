@@ -0,0 +1,62 @@
+"""Benchmark: eficiencia global muestreada (k pivotes BFS) contra nx.global_efficiency."""
+import networkx as nx
+import numpy as np
+import os
+import random
+import sys
+import time
+
+from eficiencia import EficienciaMuestreada
+from redes import leer_aristas
+
+# Uso: python benchmark_eficiencia_muestreada.py [facebook.txt] [pivotes...]
+file_path = sys.argv[1] if len(sys.argv) > 1 else 'facebook.txt'
+presupuestos = [int(k) for k in sys.argv[2:]] or [16, 64, 256]
+fracciones = [0.0, 0.1, 0.2, 0.3, 0.4]
+repeticiones = 5
+
+if not os.path.isfile(file_path):
+    raise FileNotFoundError(f"❌ El archivo '{file_path}' no se encontró.")
+
+G = nx.Graph()
+G.add_edges_from(leer_aristas(file_path))
+print(f"Grafo cargado: {G.number_of_nodes()} nodos, {G.number_of_edges()} aristas.")
+
+orden = list(G.nodes())
+random.Random(0).shuffle(orden)
+
+# -------------------------------
+# Comparación por estado del ataque
+# -------------------------------
+filas = []
+print(f"{'fraccion':>8} {'k':>5} {'t_nx':>8} {'t_k':>8} {'speedup':>8} {'err_abs':>9} {'err_rel':>8} {'|z|':>6}")
+for fraccion in fracciones:
+    H = G.copy()
+    H.remove_nodes_from(orden[:int(fraccion * len(orden))])
+
+    t0 = time.perf_counter()
+    exacta = nx.global_efficiency(H)
+    t_nx = time.perf_counter() - t0
+
+    for k in presupuestos:
+        errores, zs = [], []
+        t0 = time.perf_counter()
+        for semilla in range(repeticiones):
+            estimada, error = EficienciaMuestreada(H, pivotes=k, semilla=semilla).valor()
+            errores.append(abs(estimada - exacta))
+            zs.append(abs(estimada - exacta) / error if error > 0 else 0)
+        t_k = (time.perf_counter() - t0) / repeticiones
+
+        err_abs = float(np.mean(errores))
+        err_rel = err_abs / exacta if exacta else 0
+        filas.append((fraccion, k, t_nx, t_k, t_nx / t_k, err_abs, err_rel, float(np.mean(zs))))
+        print(f"{fraccion:8.2f} {k:5d} {t_nx:8.3f} {t_k:8.3f} {t_nx / t_k:8.1f} "
+              f"{err_abs:9.2e} {err_rel:8.2%} {np.mean(zs):6.2f}")
+
+output_path = os.path.dirname(os.path.abspath(__file__))
+output_file = os.path.join(output_path, 'benchmark_eficiencia_muestreada.csv')
+with open(output_file, 'w') as f:
+    f.write("fraccion,pivotes,t_nx,t_muestreada,speedup,error_abs,error_rel,z_medio\n")
+    for fila in filas:
+        f.write(",".join(f"{x:.6g}" for x in fila) + "\n")
+print(f"💾 Resultados guardados en '{output_file}'")
@@ -0,0 +1,57 @@
+"""Benchmark: Girvan-Newman con intermediación muestreada contra el exacto (NMI/ARI vs. speedup)."""
+import argparse
+import os
+import time
+
+from comunidades import (GirvanNewman, etiquetas_de, girvan_newman_con_modularidad, indice_rand_ajustado,
+                         informacion_mutua_normalizada)
+from redes import CARGADORES
+
+# Uso: python benchmark_gn_muestreado.py {facebook,aeropuertos} [--archivo X] [--muestras 16 64 256]
+parser = argparse.ArgumentParser()
+parser.add_argument('red', choices=sorted(CARGADORES))
+parser.add_argument('--archivo', default=None)
+parser.add_argument('--muestras', type=int, nargs='+', default=[16, 64, 256])
+parser.add_argument('--repeticiones', type=int, default=3)
+parser.add_argument('--procesos', type=int, default=None)
+args = parser.parse_args()
+
+G = CARGADORES[args.red](args.archivo) if args.archivo else CARGADORES[args.red]()
+print(f"Grafo cargado: {G.number_of_nodes()} nodos, {G.number_of_edges()} aristas.")
+
+
+# -------------------------------
+# Mejor partición de una corrida
+# -------------------------------
+def mejor_particion(muestras=None, semilla=0):
+    t0 = time.perf_counter()
+    gn = GirvanNewman(G, args.procesos, muestras=muestras, semilla=semilla)
+    mod_max, mejor = -999, None
+    for communities, n_modularidad in girvan_newman_con_modularidad(G, gn=gn):
+        if n_modularidad > mod_max:
+            mod_max, mejor = n_modularidad, etiquetas_de(communities, gn.posicion)
+    return time.perf_counter() - t0, mod_max, mejor
+
+t_exacto, q_exacto, exacta = mejor_particion()
+print(f"Exacto: {t_exacto:.2f} s, modularidad {q_exacto:.4f}, {exacta.max() + 1} comunidades")
+
+# -------------------------------
+# Comparación por cantidad de fuentes
+# -------------------------------
+filas = []
+print(f"{'k':>5} {'tiempo':>8} {'speedup':>8} {'modularidad':>11} {'NMI':>6} {'ARI':>6}")
+for k in args.muestras:
+    for semilla in range(args.repeticiones):
+        tiempo, q, particion = mejor_particion(k, semilla)
+        nmi = informacion_mutua_normalizada(exacta, particion)
+        ari = indice_rand_ajustado(exacta, particion)
+        filas.append((k, semilla, tiempo, t_exacto / tiempo, q, q_exacto, nmi, ari))
+        print(f"{k:5d} {tiempo:8.2f} {t_exacto / tiempo:8.1f} {q:11.4f} {nmi:6.3f} {ari:6.3f}")
+
+output_path = os.path.dirname(os.path.abspath(__file__))
+output_file = os.path.join(output_path, f'benchmark_gn_muestreado_{args.red}.csv')
+with open(output_file, 'w') as f:
+    f.write("muestras,semilla,tiempo,speedup,modularidad,modularidad_exacta,nmi,ari\n")
+    for fila in filas:
+        f.write(",".join(f"{x:.6g}" for x in fila) + "\n")
+print(f"💾 Resultados guardados en '{output_file}'")
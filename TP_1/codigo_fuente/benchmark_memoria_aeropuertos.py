@@ -0,0 +1,85 @@
+"""Benchmark: memoria pico al preparar airU, cadena de networkx contra arreglos (preparar_aeropuertos)."""
+import multiprocessing
+import os
+import sys
+import time
+
+import networkx as nx
+
+from redes import grafo_desde_arreglos, leer_aristas, preparar_aeropuertos
+
+# Uso: python benchmark_memoria_aeropuertos.py [airport.txt]
+file_path = sys.argv[1] if len(sys.argv) > 1 else 'airport.txt'
+if not os.path.isfile(file_path):
+    raise FileNotFoundError(f"❌ El archivo '{file_path}' no se encontró.")
+
+
+# -------------------------------
+# Variantes
+# -------------------------------
+def cadena_networkx(file_path):
+    '''La preparación que hacían los scripts: DiGraph con pesos, SCC, to_undirected, copy y drop_weights.'''
+    air = nx.DiGraph()
+    air.add_weighted_edges_from(leer_aristas(file_path))
+    airStronglyCC = sorted(nx.strongly_connected_components(air), key=len, reverse=True)
+    airStrongly = air.subgraph(airStronglyCC[0])
+    airU = nx.DiGraph.to_undirected(airStrongly).copy()
+    for node, edges in nx.to_dict_of_dicts(airU).items():
+        for edge, attrs in edges.items():
+            attrs.pop('weight', None)
+    return airU
+
+def desde_arreglos(file_path):
+    nodos, aristas, _ = preparar_aeropuertos(file_path)
+    return grafo_desde_arreglos(nodos, aristas)
+
+VARIANTES = {'networkx': cadena_networkx, 'arreglos': desde_arreglos}
+
+
+# -------------------------------
+# Medición en un proceso aparte
+# -------------------------------
+def _memoria(campo):
+    '''VmRSS / VmHWM del proceso en MB, de /proc/self/status.'''
+    with open('/proc/self/status') as f:
+        for linea in f:
+            if linea.startswith(campo + ':'):
+                return int(linea.split()[1]) / 1024
+    return float('nan')
+
+def _medir(nombre, conexion):
+    # Reinicia el pico (VmHWM) para no heredar el del proceso padre
+    with open('/proc/self/clear_refs', 'w') as f:
+        f.write('5')
+    base = _memoria('VmRSS')
+    t0 = time.perf_counter()
+    G = VARIANTES[nombre](file_path)
+    tiempo = time.perf_counter() - t0
+    conexion.send((tiempo, _memoria('VmHWM') - base, _memoria('VmRSS') - base,
+                   G.number_of_nodes(), G.number_of_edges()))
+
+# El .npy de leer_aristas se arma antes, así ninguna variante paga el parseo
+leer_aristas(file_path)
+contexto = multiprocessing.get_context('fork')
+filas = []
+print(f"{'variante':>10} {'tiempo':>8} {'pico_MB':>9} {'final_MB':>9} {'nodos':>7} {'aristas':>8}")
+for nombre in VARIANTES:
+    recibir, enviar = contexto.Pipe(duplex=False)
+    proceso = contexto.Process(target=_medir, args=(nombre, enviar))
+    proceso.start()
+    tiempo, pico, final, nodos, aristas = recibir.recv()
+    proceso.join()
+    filas.append((nombre, tiempo, pico, final, nodos, aristas))
+    print(f"{nombre:>10} {tiempo:8.2f} {pico:9.1f} {final:9.1f} {nodos:7d} {aristas:8d}")
+
+referencia = filas[0][2]
+for nombre, _, pico, *_ in filas[1:]:
+    print(f"📉 {nombre}: pico {pico:.1f} MB contra {referencia:.1f} MB ({pico / referencia:.0%} del de networkx)")
+
+output_path = os.path.dirname(os.path.abspath(__file__))
+output_file = os.path.join(output_path, 'benchmark_memoria_aeropuertos.csv')
+with open(output_file, 'w') as f:
+    f.write("variante,tiempo,pico_mb,final_mb,nodos,aristas\n")
+    for nombre, *valores in filas:
+        f.write(nombre + "," + ",".join(f"{x:.6g}" for x in valores) + "\n")
+print(f"💾 Resultados guardados en '{output_file}'")
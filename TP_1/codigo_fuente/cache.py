@@ -0,0 +1,101 @@
+"""Caché en disco de centralidades, direccionada por el contenido del grafo."""
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from ataques import calcular_centralidad, parametros_de
+from centralidades import centralidades_en_una_pasada
+
+CARPETA_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+
+
+# -------------------------------
+# Claves
+# -------------------------------
+def huella_grafo(G):
+    '''SHA-256 de los nodos y aristas de G, independiente del orden de inserción.'''
+    h = hashlib.sha256()
+    h.update(b'dirigido' if G.is_directed() else b'no dirigido')
+    for nodo in sorted(G, key=repr):
+        h.update(repr(nodo).encode() + b'\0')
+    if G.is_directed():
+        aristas = (tuple(map(repr, arista)) for arista in G.edges())
+    else:
+        aristas = (tuple(sorted(map(repr, arista))) for arista in G.edges())
+    for u, v in sorted(aristas):
+        h.update(f'{u} {v}\n'.encode())
+    return h.hexdigest()
+
+def clave_centralidad(G, medida, parametros, huella=None):
+    '''Clave de la caché: huella del grafo, medida y parámetros efectivos.'''
+    descripcion = json.dumps({'grafo': huella or huella_grafo(G), 'medida': medida,
+                              'parametros': parametros}, sort_keys=True, default=repr)
+    return hashlib.sha256(descripcion.encode()).hexdigest()
+
+
+# -------------------------------
+# Centralidades
+# -------------------------------
+def guardar_centralidad(archivo, centralidad, medida, parametros):
+    '''Escribe el .npz en un temporal y lo renombra, así otro proceso nunca lee uno a medias.'''
+    carpeta = os.path.dirname(archivo)
+    os.makedirs(carpeta, exist_ok=True)
+    fd, temporal = tempfile.mkstemp(dir=carpeta, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        np.savez_compressed(f, nodos=np.asarray(list(centralidad)),
+                            valores=np.fromiter(centralidad.values(), dtype=float),
+                            medida=medida, parametros=json.dumps(parametros, default=repr))
+    os.replace(temporal, archivo)
+
+def leer_centralidad(archivo):
+    with np.load(archivo) as datos:
+        return dict(zip(datos['nodos'].tolist(), datos['valores'].tolist()))
+
+def archivo_centralidad(G, medida, parametros, carpeta=None, huella=None):
+    clave = clave_centralidad(G, medida, parametros, huella)
+    return os.path.join(carpeta or CARPETA_CACHE, f'{medida}_{clave[:16]}.npz')
+
+def centralidad_cacheada(G, medida, carpeta=None, **parametros):
+    '''Centralidad `medida` de G, leída de la caché o calculada y guardada.
+
+    La clave combina la huella del grafo ya preparado, la medida y sus
+    parámetros (los de ataques.PARAMETROS más los que se pasen), así que
+    cualquier cambio en el grafo o en la configuración da un archivo nuevo.
+    Cada entrada es un .npz con los nodos y los valores en el orden de G.
+    '''
+    parametros = parametros_de(medida, **parametros)
+    archivo = archivo_centralidad(G, medida, parametros, carpeta)
+    if os.path.isfile(archivo):
+        print(f"🗃️ Centralidad '{medida}' leída de la caché: {archivo}")
+        return leer_centralidad(archivo)
+    centralidad = calcular_centralidad(G, medida, **parametros)
+    guardar_centralidad(archivo, centralidad, medida, parametros)
+    print(f"🗃️ Centralidad '{medida}' guardada en la caché: {archivo}")
+    return centralidad
+
+def precalcular_en_una_pasada(G, medidas, carpeta=None):
+    '''Calcula juntas, con centralidades_en_una_pasada, las medidas de BFS que faltan en la caché.
+
+    Intermediación y cercanía comparten el barrido de Brandes; si faltan las
+    dos se calculan en una sola pasada y se guardan por separado, así las
+    llamadas siguientes a centralidad_cacheada las encuentran.
+    '''
+    if G.is_directed():
+        return
+    huella = huella_grafo(G)
+    faltan = {}
+    for medida in ('intermediacion', 'cercania'):
+        if medida in medidas:
+            parametros = parametros_de(medida)
+            archivo = archivo_centralidad(G, medida, parametros, carpeta, huella)
+            if not os.path.isfile(archivo):
+                faltan[medida] = (archivo, parametros)
+    if len(faltan) < 2:
+        return
+    print(f"📊 Calculando {', '.join(faltan)} en una sola pasada...")
+    tabla = centralidades_en_una_pasada(G, list(faltan))
+    for medida, (archivo, parametros) in faltan.items():
+        guardar_centralidad(archivo, tabla[medida].to_dict(), medida, parametros)
@@ -0,0 +1,432 @@
+"""Centralidades de los ataques calculadas en paralelo o con menos trabajo que networkx."""
+import multiprocessing
+import os
+from collections import deque
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.linalg import ArpackNoConvergence, eigs, eigsh
+from scipy.stats import kendalltau
+
+from eficiencia import indexar, sumas_de_distancias
+
+
+# -------------------------------
+# Intermediación (Brandes) en paralelo
+# -------------------------------
+_compartido = {}
+
+def _iniciar_trabajador(vecinos):
+    # La lista de adyacencia llega una sola vez por proceso (fork), no en cada tarea
+    _compartido['vecinos'] = vecinos
+
+def _dependencias(tarea):
+    '''Suma de las dependencias de Brandes de las fuentes dadas, por índice de nodo.
+
+    Con distancias=True aprovecha el mismo BFS para guardar, en la fila de
+    cada fuente, los nodos alcanzados, la suma de distancias y la de 1/d;
+    devuelve entonces un arreglo 4 x n con las dependencias en la fila 0.
+    '''
+    fuentes, distancias = tarea
+    vecinos = _compartido['vecinos']
+    n = len(vecinos)
+    acumulado = [0.0] * n
+    if distancias:
+        alcanzados = [0] * n
+        suma_distancias = [0] * n
+        suma_inversas = [0.0] * n
+    for s in fuentes:
+        pila = []
+        predecesores = [[] for _ in range(n)]
+        sigma = [0] * n
+        sigma[s] = 1
+        distancia = [-1] * n
+        distancia[s] = 0
+        cola = deque([s])
+        while cola:
+            v = cola.popleft()
+            pila.append(v)
+            siguiente = distancia[v] + 1
+            for w in vecinos[v]:
+                if distancia[w] < 0:
+                    distancia[w] = siguiente
+                    cola.append(w)
+                if distancia[w] == siguiente:
+                    sigma[w] += sigma[v]
+                    predecesores[w].append(v)
+        if distancias:
+            alcanzados[s] = len(pila) - 1
+            for v in pila[1:]:
+                suma_distancias[s] += distancia[v]
+                suma_inversas[s] += 1 / distancia[v]
+        delta = [0.0] * n
+        while pila:
+            w = pila.pop()
+            coeficiente = (1 + delta[w]) / sigma[w]
+            for v in predecesores[w]:
+                delta[v] += sigma[v] * coeficiente
+            if w != s:
+                acumulado[w] += delta[w]
+    if distancias:
+        return np.array([acumulado, alcanzados, suma_distancias, suma_inversas], dtype=float)
+    return np.array(acumulado)
+
+def _escala(n, normalized, dirigido, origenes=None):
+    '''Factor por nodo del reescalado de nx.betweenness_centrality (endpoints=False).
+
+    Sin muestreo hay N = n - 1 destinos posibles por fuente; con fuentes
+    muestreadas las fuentes no pueden pasar por sí mismas, así que se
+    escalan con k - 1 en lugar de k.
+    '''
+    N = n - 1
+    escala = np.ones(n)
+    if N < 2:
+        return escala
+    correccion = 1 if dirigido else 2
+    if origenes is None:
+        escala *= 1 / (N * (N - 1)) if normalized else 1 / correccion
+        return escala
+    k = len(origenes)
+    if normalized:
+        fuente, resto = (1 / ((k - 1) * (N - 1)) if k > 1 else np.nan), 1 / (k * (N - 1))
+    else:
+        fuente, resto = (N / ((k - 1) * correccion) if k > 1 else np.nan), N / (k * correccion)
+    escala *= resto
+    escala[list(set(origenes))] = fuente
+    return escala
+
+def _abrir_pool(vecinos, procesos):
+    '''Pool de trabajadores con la adyacencia ya cargada (None si alcanza con un proceso).
+
+    Sin pool la adyacencia queda en este proceso hasta _cerrar_pool.
+    '''
+    if procesos <= 1:
+        _iniciar_trabajador(vecinos)
+        return None
+    contexto = multiprocessing.get_context('fork')
+    return contexto.Pool(procesos, initializer=_iniciar_trabajador, initargs=(vecinos,))
+
+def _cerrar_pool(pool):
+    if pool is not None:
+        pool.terminate()
+    _compartido.clear()
+
+def _sumar_dependencias(pool, origenes, procesos, n, distancias=False):
+    if pool is None:
+        return _dependencias((origenes, distancias))
+    # Varios bloques por proceso para que ninguno quede esperando al final
+    bloques = [origenes[i::procesos * 4] for i in range(procesos * 4)]
+    total = np.zeros((4, n) if distancias else n)
+    for parcial in pool.imap_unordered(_dependencias, [(b, distancias) for b in bloques if b]):
+        total += parcial
+    return total
+
+def intermediacion_paralela(G, normalized=True, procesos=None, fuentes=None):
+    '''Intermediación de Brandes repartiendo las fuentes entre procesos.
+
+    Las fuentes se dividen en bloques; cada proceso acumula las dependencias
+    de sus bloques en un arreglo y al final se suman. La adyacencia se
+    comparte con los trabajadores una sola vez, al crear el pool. Coincide
+    con nx.betweenness_centrality (grafos sin pesos) salvo redondeo.
+
+    Con `fuentes` se usa solo ese subconjunto de nodos como orígenes y el
+    resultado se reescala como con el parámetro k de networkx.
+    '''
+    nodos, indice, conjuntos = indexar(G)
+    vecinos = [list(v) for v in conjuntos]
+    n = len(nodos)
+    muestreo = fuentes is not None
+    origenes = [indice[s] for s in fuentes] if muestreo else list(range(n))
+
+    procesos = min(procesos or os.cpu_count(), max(len(origenes), 1))
+    pool = _abrir_pool(vecinos, procesos)
+    try:
+        total = _sumar_dependencias(pool, origenes, procesos, n)
+    finally:
+        _cerrar_pool(pool)
+
+    total *= _escala(n, normalized, G.is_directed(), origenes if muestreo else None)
+    return dict(zip(nodos, total.tolist()))
+
+
+# -------------------------------
+# Intermediación aproximada
+# -------------------------------
+def _ranking_estable(previo, actual, top, criterio, umbral):
+    '''Compara los top-`top` de dos estimaciones sucesivas.'''
+    a = set(np.argsort(-previo, kind='stable')[:top].tolist())
+    b = set(np.argsort(-actual, kind='stable')[:top].tolist())
+    if criterio == 'solapamiento':
+        return len(a & b) / top >= umbral
+    union = sorted(a | b)
+    tau = kendalltau(previo[union], actual[union]).statistic
+    return not np.isnan(tau) and tau >= umbral
+
+def intermediacion_aproximada(G, top=50, criterio='solapamiento', umbral=0.9,
+                              muestras_iniciales=64, max_muestras=None, semilla=0,
+                              procesos=None, normalized=True, informe=None):
+    '''Intermediación muestreada que agrega fuentes hasta que el top del ranking se estabiliza.
+
+    Empieza con `muestras_iniciales` fuentes al azar (con `semilla`) y en
+    cada ronda duplica la cantidad, reutilizando las dependencias ya
+    acumuladas. Termina cuando dos rondas seguidas coinciden en los `top`
+    nodos más centrales según `criterio`:
+
+    - 'solapamiento': fracción de nodos compartidos >= umbral.
+    - 'kendall': tau de Kendall sobre la unión de ambos top >= umbral.
+
+    o al llegar a max_muestras (por defecto todos los nodos, que da el valor
+    exacto). Las estimaciones se escalan como nx.betweenness_centrality(k=...)
+    y el diccionario va directo a estrategia_tradicional. Si se pasa un
+    diccionario en `informe` se completa con las muestras usadas y las rondas.
+    '''
+    if criterio not in ('solapamiento', 'kendall'):
+        raise ValueError(f"criterio debe ser 'solapamiento' o 'kendall', no {criterio!r}")
+    if muestras_iniciales < 1:
+        raise ValueError(f"muestras_iniciales debe ser al menos 1, no {muestras_iniciales!r}")
+    nodos, _, conjuntos = indexar(G)
+    vecinos = [list(v) for v in conjuntos]
+    n = len(nodos)
+    max_muestras = min(max_muestras or n, n)
+    top = max(1, min(top, n))
+    orden = np.random.default_rng(semilla).permutation(n).tolist()
+    dirigido = G.is_directed()
+
+    procesos = max(1, procesos or os.cpu_count())
+    pool = _abrir_pool(vecinos, procesos)
+    total = np.zeros(n)
+    usadas = 0
+    previo = None
+    rondas = 0
+    try:
+        while True:
+            nuevas = min(max(muestras_iniciales, usadas), max_muestras - usadas)
+            total += _sumar_dependencias(pool, orden[usadas:usadas + nuevas], procesos, n)
+            usadas += nuevas
+            rondas += 1
+            exacta = usadas == n
+            actual = total * _escala(n, normalized, dirigido, None if exacta else orden[:usadas])
+            if exacta or usadas >= max_muestras:
+                break
+            if previo is not None and _ranking_estable(previo, actual, top, criterio, umbral):
+                break
+            previo = actual
+    finally:
+        _cerrar_pool(pool)
+
+    print(f"🎯 Intermediación aproximada: {usadas}/{n} fuentes en {rondas} rondas")
+    if informe is not None:
+        informe.update(muestras=usadas, rondas=rondas, exacta=exacta)
+    return dict(zip(nodos, np.nan_to_num(actual).tolist()))
+
+
+# -------------------------------
+# Cercanía con BFS bit-paralelo
+# -------------------------------
+def _cercania(alcanzados, suma_distancias, n, wf_improved=True):
+    '''Cercanía de networkx a partir de los alcanzados y la suma de distancias de cada nodo.'''
+    cercania = np.zeros(n)
+    hay = suma_distancias > 0
+    cercania[hay] = alcanzados[hay] / suma_distancias[hay]
+    if wf_improved and n > 1:
+        cercania *= alcanzados / (n - 1)
+    return cercania
+
+def cercania_bitparalela(G, wf_improved=True, palabras=4):
+    '''nx.closeness_centrality (sin pesos) con eficiencia.sumas_de_distancias.
+
+    En dirigidos, como networkx, usa las distancias entrantes (BFS sobre la
+    traspuesta).
+    '''
+    nodos = list(G)
+    n = len(nodos)
+    A = nx.to_scipy_sparse_array(G, nodelist=nodos, weight=None, dtype=np.int8, format='csr')
+    if G.is_directed():
+        A = A.T.tocsr()
+    alcanzados, suma_distancias, _ = sumas_de_distancias(A, palabras=palabras)
+    return dict(zip(nodos, _cercania(alcanzados, suma_distancias, n, wf_improved).tolist()))
+
+
+# -------------------------------
+# Eigenvector y PageRank con scipy.sparse
+# -------------------------------
+def _adyacencia(G):
+    nodos = list(G)
+    A = nx.to_scipy_sparse_array(G, nodelist=nodos, weight=None, dtype=float, format='csr')
+    return nodos, A
+
+def _vector_inicial(nodos, inicial):
+    '''Vector de arranque en el orden de nodos (los nodos que faltan arrancan en 0).'''
+    if inicial is None:
+        return None
+    x = np.array([inicial.get(n, 0) for n in nodos], dtype=float)
+    return x if x.sum() > 0 else None
+
+def autovector_disperso(G, inicial=None, tol=1.0e-6, max_iter=1000):
+    '''Centralidad de autovector con ARPACK (Lanczos) sobre la adyacencia dispersa.
+
+    Da el mismo vector que nx.eigenvector_centrality (norma euclídea 1,
+    entradas no negativas) sin depender de que converja la iteración de
+    potencias. `inicial` (un diccionario, por ejemplo el vector del grafo
+    antes de sacar un nodo) se usa como vector de arranque de ARPACK.
+    '''
+    if len(G) == 0:
+        raise nx.NetworkXPointlessConcept("no se puede calcular la centralidad de un grafo vacío")
+    nodos, A = _adyacencia(G)
+    # Como networkx: en dirigidos cuenta la centralidad de los predecesores
+    M = A.T if G.is_directed() else A
+    v0 = _vector_inicial(nodos, inicial)
+    if v0 is not None:
+        # Si el vector anterior vive solo en nodos que quedaron aislados, A v0 = 0
+        # y ARPACK corta ("Starting vector is zero"); un piso chico lo evita
+        v0 = v0 + v0.sum() / len(v0) * 1e-3
+    if len(nodos) < 3:
+        valores, vectores = np.linalg.eig(M.toarray())
+        x = np.real(vectores[:, np.argmax(np.real(valores))])
+    else:
+        try:
+            if G.is_directed():
+                _, vectores = eigs(M, k=1, which='LR', v0=v0, tol=tol, maxiter=max_iter * len(nodos))
+            else:
+                _, vectores = eigsh(M, k=1, which='LA', v0=v0, tol=tol, maxiter=max_iter * len(nodos))
+        except ArpackNoConvergence as error:
+            raise nx.PowerIterationFailedConvergence(max_iter) from error
+        x = np.real(vectores[:, 0])
+    x = x * np.sign(x.sum()) / np.linalg.norm(x)
+    return dict(zip(nodos, x.tolist()))
+
+def autovector_en_lote(grafos, iniciales=None, tol=1.0e-6, max_iter=1000):
+    '''Centralidad de autovector de varios grafos en una sola iteración de potencias vectorizada.
+
+    Repite la iteración de nx.eigenvector_centrality (x <- x + x A,
+    normalizado por la norma euclídea) sobre la adyacencia diagonal por
+    bloques, normalizando cada bloque por separado, hasta que todos cumplen
+    el criterio de networkx, error L1 < n * tol. Da el vector de networkx
+    con esa tolerancia (autovector_disperso usa ARPACK, así que pueden
+    diferir en ese orden). Cada grafo puede arrancar de su vector anterior
+    (iniciales).
+    '''
+    if not grafos:
+        return []
+    iniciales = iniciales or [None] * len(grafos)
+    listas, bloques, x, largos = [], [], [], []
+    for G, inicial in zip(grafos, iniciales):
+        if len(G) == 0:
+            raise nx.NetworkXPointlessConcept("no se puede calcular la centralidad de un grafo vacío")
+        nodos, A = _adyacencia(G)
+        listas.append(nodos)
+        bloques.append(A)
+        largos.append(len(nodos))
+        x0 = _vector_inicial(nodos, inicial)
+        x.append(x0 / x0.sum() if x0 is not None else np.full(len(nodos), 1 / len(nodos)))
+
+    A = sp.block_diag(bloques, format='csr')
+    largos = np.array(largos)
+    inicios = np.concatenate(([0], np.cumsum(largos)[:-1]))
+    bloque = np.repeat(np.arange(len(grafos)), largos)
+    x = np.concatenate(x)
+
+    for _ in range(max_iter):
+        previo = x
+        # En dirigidos x A suma sobre los predecesores, como networkx
+        x = previo + previo @ A
+        norma = np.sqrt(np.add.reduceat(x * x, inicios))
+        norma[norma == 0] = 1
+        x = x / norma[bloque]
+        error = np.add.reduceat(np.abs(x - previo), inicios)
+        if np.all(error < largos * tol):
+            return [dict(zip(nodos, x[i:i + n].tolist()))
+                    for nodos, i, n in zip(listas, inicios, largos)]
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+def pagerank_en_lote(grafos, alpha=0.85, iniciales=None, tol=1.0e-6, max_iter=1000):
+    '''PageRank de varios grafos en una sola iteración de potencias vectorizada.
+
+    Los grafos se apilan en una matriz de transición diagonal por bloques y
+    el teletransporte y los nodos sin salida se reparten dentro de cada
+    bloque, así cada bloque converge al PageRank de su grafo (el mismo que
+    nx.pagerank sin pesos). Cada grafo puede arrancar de su vector
+    anterior (iniciales); se itera hasta que todos cumplen el criterio de
+    networkx, error L1 < n * tol.
+    '''
+    if not grafos:
+        return []
+    iniciales = iniciales or [None] * len(grafos)
+    listas, bloques, x, largos = [], [], [], []
+    for G, inicial in zip(grafos, iniciales):
+        if len(G) == 0:
+            raise nx.NetworkXPointlessConcept("no se puede calcular el PageRank de un grafo vacío")
+        nodos, A = _adyacencia(G)
+        listas.append(nodos)
+        bloques.append(A)
+        largos.append(len(nodos))
+        x0 = _vector_inicial(nodos, inicial)
+        x.append(x0 / x0.sum() if x0 is not None else np.full(len(nodos), 1 / len(nodos)))
+
+    A = sp.block_diag(bloques, format='csr')
+    salida = np.asarray(A.sum(axis=1)).ravel()
+    sin_salida = salida == 0
+    salida[~sin_salida] = 1 / salida[~sin_salida]
+    Q = sp.diags(salida, format='csr') @ A
+    largos = np.array(largos)
+    inicios = np.concatenate(([0], np.cumsum(largos)[:-1]))
+    bloque = np.repeat(np.arange(len(grafos)), largos)
+    p = 1 / largos[bloque]
+    x = np.concatenate(x)
+
+    for _ in range(max_iter):
+        previo = x
+        colgante = np.add.reduceat(np.where(sin_salida, x, 0), inicios)
+        x = alpha * (x @ Q + colgante[bloque] * p) + (1 - alpha) * p
+        error = np.add.reduceat(np.abs(x - previo), inicios)
+        if np.all(error < largos * tol):
+            return [dict(zip(nodos, x[i:i + n].tolist()))
+                    for nodos, i, n in zip(listas, inicios, largos)]
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+def pagerank_disperso(G, alpha=0.85, inicial=None, tol=1.0e-6, max_iter=1000):
+    '''PageRank de un grafo con arranque en caliente (ver pagerank_en_lote).'''
+    return pagerank_en_lote([G], alpha, [inicial], tol, max_iter)[0]
+
+
+# -------------------------------
+# Varias centralidades en una pasada
+# -------------------------------
+UNA_PASADA = ('grado', 'intermediacion', 'cercania', 'armonica', 'eficiencia')
+
+@nx.utils.not_implemented_for("directed")
+def centralidades_en_una_pasada(G, medidas=UNA_PASADA, procesos=None):
+    '''Tabla nodo x medida con un solo barrido de Brandes por fuente.
+
+    Del mismo BFS de cada fuente salen las dependencias (intermediación) y
+    las sumas de distancias y de 1/d, que dan cercanía, armónica y la
+    eficiencia nodal (suma de 1/d sobre n - 1); grado no necesita BFS.
+    Cada columna coincide con su función de networkx (betweenness y
+    closeness normalizadas, harmonic_centrality, degree_centrality). Las
+    fuentes se reparten entre procesos como en intermediacion_paralela.
+    '''
+    for medida in medidas:
+        if medida not in UNA_PASADA:
+            raise ValueError(f"medida debe ser una de {UNA_PASADA}, no {medida!r}")
+    nodos, _, conjuntos = indexar(G)
+    vecinos = [list(v) for v in conjuntos]
+    n = len(nodos)
+    columnas = {}
+    if 'grado' in medidas:
+        grados = np.array([g for _, g in G.degree(nodos)], dtype=float)
+        columnas['grado'] = grados / (n - 1) if n > 1 else np.ones(n)
+    if set(medidas) - {'grado'}:
+        procesos = min(procesos or os.cpu_count(), max(n, 1))
+        pool = _abrir_pool(vecinos, procesos)
+        try:
+            acumulado, alcanzados, suma_distancias, suma_inversas = _sumar_dependencias(
+                pool, list(range(n)), procesos, n, distancias=True)
+        finally:
+            _cerrar_pool(pool)
+        columnas['intermediacion'] = acumulado * _escala(n, True, False)
+        columnas['cercania'] = _cercania(alcanzados, suma_distancias, n)
+        columnas['armonica'] = suma_inversas
+        columnas['eficiencia'] = suma_inversas / (n - 1) if n > 1 else np.zeros(n)
+    return pd.DataFrame({medida: columnas[medida] for medida in medidas}, index=nodos)
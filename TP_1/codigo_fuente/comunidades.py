@@ -0,0 +1,680 @@
+"""Girvan-Newman incremental (intermediación de aristas por componente), modularidad incremental y dendrograma."""
+import argparse
+import multiprocessing
+import os
+import pickle
+from collections import deque
+
+import networkx as nx
+import numpy as np
+
+
+# -------------------------------
+# Intermediación de aristas de una componente
+# -------------------------------
+def _aporte_de_fuente(s, vecinos, ids, aporte):
+    '''Escribe en `aporte` (en cero) el aporte de la fuente s a la intermediación de cada arista.
+
+    Repite paso a paso las operaciones de nx.edge_betweenness_centrality
+    (mismo orden de BFS, de predecesores y de acumulación), así que las
+    sumas en el mismo orden de fuentes dan exactamente los mismos flotantes.
+    '''
+    n = len(vecinos)
+    pila = []
+    predecesores = [[] for _ in range(n)]
+    sigma = [0.0] * n
+    sigma[s] = 1.0
+    distancia = [-1] * n
+    distancia[s] = 0
+    cola = deque([s])
+    while cola:
+        v = cola.popleft()
+        pila.append(v)
+        siguiente = distancia[v] + 1
+        sigma_v = sigma[v]
+        for w, e in zip(vecinos[v], ids[v]):
+            if distancia[w] < 0:
+                cola.append(w)
+                distancia[w] = siguiente
+            if distancia[w] == siguiente:
+                sigma[w] += sigma_v
+                predecesores[w].append((v, e))
+    delta = [0] * n
+    while pila:
+        w = pila.pop()
+        coeficiente = (1 + delta[w]) / sigma[w]
+        for v, e in predecesores[w]:
+            c = sigma[v] * coeficiente
+            aporte[e] = c
+            delta[v] += c
+
+_compartido = {}
+
+def _iniciar_trabajador(vecinos, ids):
+    # La componente llega una sola vez por proceso (fork), no en cada bloque
+    _compartido.update(vecinos=vecinos, ids=ids)
+
+def _aportes_aristas(tarea):
+    '''Matriz fuentes x aristas (índices locales) con el aporte de cada fuente del bloque.'''
+    fuentes, m = tarea
+    vecinos, ids = _compartido['vecinos'], _compartido['ids']
+    aportes = np.zeros((len(fuentes), m))
+    for fila, s in enumerate(fuentes):
+        _aporte_de_fuente(s, vecinos, ids, aportes[fila])
+    return aportes
+
+def _sumar_aportes(fuentes, vecinos, ids, m):
+    '''Suma de los aportes fuente por fuente, en O(m) de memoria (mismo orden de suma que por bloques).'''
+    total = np.zeros(m)
+    aporte = np.zeros(m)
+    for s in fuentes:
+        aporte.fill(0)
+        _aporte_de_fuente(s, vecinos, ids, aporte)
+        total += aporte
+    return total
+
+
+# -------------------------------
+# Girvan-Newman
+# -------------------------------
+class GirvanNewman:
+    '''Estado de Girvan-Newman con la intermediación de aristas guardada por componente.
+
+    Al sacar una arista solo cambia la intermediación dentro de su
+    componente, así que solo se recalcula esa componente (o las dos en que
+    se partió); las demás conservan sus valores. Las fuentes se recorren en
+    el orden de G y los aportes se suman en ese orden, y los empates se
+    resuelven por el orden de G.edges(), así que la arista elegida en cada
+    paso (y el dendrograma) es la misma que con nx.community.girvan_newman.
+
+    Con procesos > 1 las fuentes de las componentes grandes se reparten en
+    bloques entre los procesos de un pool que se abre para esa componente;
+    los aportes vuelven por fuente y se suman en el proceso principal en el
+    mismo orden, sin cambiar el resultado.
+
+    self.removidas lleva los rangos (posición en G.edges()) de las aristas
+    sacadas; pasándolos en `removidas` se retoma una corrida desde ese punto.
+
+    Con `muestras` = k la intermediación de cada componente de más de k
+    nodos se estima con k fuentes al azar, escalada por |C| / k (Brandes y
+    Pich), y como el resto solo se vuelve a muestrear la componente que
+    cambió. La muestra de una componente depende de `semilla`, de su primer
+    nodo y de su cantidad de aristas, que la identifican en toda la corrida,
+    así que retomar un punto de control da la misma secuencia.
+    '''
+
+    def __init__(self, G, procesos=1, minimo_paralelo=256, removidas=(), muestras=None, semilla=0):
+        self.g = G.copy().to_undirected()
+        # Los lazos no cambian las componentes, igual que en networkx
+        self.g.remove_edges_from(list(nx.selfloop_edges(self.g)))
+        self.posicion = {nodo: i for i, nodo in enumerate(self.g)}
+        self.rango = {}
+        for i, (u, v) in enumerate(self.g.edges()):
+            self.rango[u, v] = self.rango[v, u] = i
+        self.arista = {i: (u, v) for (u, v), i in self.rango.items()}
+        self.removidas = [int(r) for r in removidas]
+        # Sacar aristas no cambia el orden relativo de las que quedan
+        self.g.remove_edges_from(self.arista[r] for r in self.removidas)
+        n = len(self.g)
+        self.escala = 1 / (n * (n - 1)) if n > 1 else 1
+        self.muestras = muestras
+        self.semilla = semilla
+
+        self.procesos = procesos or os.cpu_count()
+        self.minimo_paralelo = minimo_paralelo
+
+        self.componente = {}
+        self.miembros = {}
+        self.valores = {}
+        self.mejor = {}
+        self.siguiente_id = 0
+        for nodos in nx.connected_components(self.g):
+            self._agregar(nodos)
+
+    def _agregar(self, nodos):
+        '''Registra una componente y calcula la intermediación de sus aristas.'''
+        cid = self.siguiente_id
+        self.siguiente_id += 1
+        nodos = sorted(nodos, key=self.posicion.__getitem__)
+        for nodo in nodos:
+            self.componente[nodo] = cid
+        self.miembros[cid] = nodos
+        valores = self._intermediacion(nodos)
+        self.valores[cid] = valores
+        self.mejor[cid] = max(((b * self.escala, -i) for i, b in valores.items()), default=None)
+        return cid
+
+    def _intermediacion(self, nodos):
+        '''Intermediación sin normalizar de las aristas de la componente, por rango.'''
+        local = {nodo: i for i, nodo in enumerate(nodos)}
+        rangos = []
+        local_arista = {}
+        vecinos = []
+        ids = []
+        for nodo in nodos:
+            fila_vecinos = []
+            fila_ids = []
+            for w in self.g[nodo]:
+                r = self.rango[nodo, w]
+                if r not in local_arista:
+                    local_arista[r] = len(rangos)
+                    rangos.append(r)
+                fila_vecinos.append(local[w])
+                fila_ids.append(local_arista[r])
+            vecinos.append(fila_vecinos)
+            ids.append(fila_ids)
+        m = len(rangos)
+        if m == 0:
+            return {}
+
+        fuentes = list(range(len(nodos)))
+        if self.muestras and len(nodos) > self.muestras:
+            rng = np.random.default_rng([self.semilla, self.posicion[nodos[0]], m])
+            fuentes = sorted(rng.choice(len(nodos), self.muestras, replace=False).tolist())
+        if self.procesos <= 1 or len(fuentes) < self.minimo_paralelo:
+            total = _sumar_aportes(fuentes, vecinos, ids, m)
+        else:
+            # Bloques de ~32 MB de aportes para acotar la memoria
+            tamanio = max(1, min(len(fuentes) // self.procesos, (1 << 22) // m))
+            tareas = [(fuentes[i:i + tamanio], m) for i in range(0, len(fuentes), tamanio)]
+            total = np.zeros(m)
+            contexto = multiprocessing.get_context('fork')
+            with contexto.Pool(self.procesos, initializer=_iniciar_trabajador, initargs=(vecinos, ids)) as pool:
+                for aportes in pool.imap(_aportes_aristas, tareas):
+                    for fila in aportes:
+                        total += fila
+        if len(fuentes) < len(nodos):
+            total *= len(nodos) / len(fuentes)
+        return dict(zip(rangos, total.tolist()))
+
+    def arista_central(self):
+        '''Arista de mayor intermediación (la primera de G.edges() si hay empate).'''
+        cid = max((c for c in self.mejor if self.mejor[c] is not None), key=self.mejor.__getitem__)
+        return self.arista[-self.mejor[cid][1]]
+
+    def eliminar(self, u, v):
+        '''Saca la arista y recalcula la componente; devuelve los ids de las piezas que quedan.'''
+        self.g.remove_edge(u, v)
+        self.removidas.append(self.rango[u, v])
+        cid = self.componente[u]
+        del self.miembros[cid], self.valores[cid], self.mejor[cid]
+        pieza = nx.node_connected_component(self.g, u)
+        if v in pieza:
+            return cid, (self._agregar(pieza),)
+        otra = nx.node_connected_component(self.g, v)
+        return cid, (self._agregar(pieza), self._agregar(otra))
+
+    def comunidades(self):
+        '''Componentes en el mismo orden que nx.connected_components.'''
+        return tuple(set(m) for m in sorted(self.miembros.values(), key=lambda m: self.posicion[m[0]]))
+
+    def dividir(self):
+        '''Saca aristas centrales hasta que aumenta la cantidad de componentes.
+
+        Las dos partes de la componente que se partió quedan en
+        self.ultima_division.
+        '''
+        while True:
+            u, v = self.arista_central()
+            _, piezas = self.eliminar(u, v)
+            if len(piezas) == 2:
+                self.ultima_division = tuple(self.miembros[p] for p in piezas)
+                return self.comunidades()
+
+# -------------------------------
+# Modularidad incremental
+# -------------------------------
+class ModularidadIncremental:
+    '''Modularidad de una partición de G que se actualiza al partir una comunidad.
+
+    Guarda por comunidad la cantidad de aristas internas L_c y la suma de
+    grados D_c (enteros, sobre el grafo original G), y los totales
+    sum(L_c) y sum(D_c²), así que Q = sum(L_c) / m - sum(D_c²) / (4 m²) es
+    exacto en cada nivel. Al partir c en a y b solo se recorre la parte más
+    chica: L y D de la otra salen por diferencia con los de c.
+    '''
+
+    def __init__(self, G, comunidades):
+        self.G = G
+        self.m = G.number_of_edges()
+        self.comunidad = {}
+        self.internas = {}
+        self.grados = {}
+        self.total_internas = 0
+        self.total_cuadrados = 0
+        self.siguiente_id = 0
+        for nodos in comunidades:
+            internas, grados, _ = self._contar(set(nodos))
+            self._registrar(nodos, internas, grados)
+
+    def _contar(self, nodos, cid=None):
+        '''Aristas internas y suma de grados del conjunto, y aristas hacia el resto de la comunidad cid.'''
+        dobles = grados = corte = 0
+        for u in nodos:
+            for w in self.G[u]:
+                if w == u:
+                    # El lazo aparece una vez en G[u] pero suma 2 al grado
+                    dobles += 2
+                    grados += 2
+                else:
+                    grados += 1
+                    if w in nodos:
+                        dobles += 1
+                    elif self.comunidad.get(w) == cid:
+                        corte += 1
+        return dobles // 2, grados, corte
+
+    def _registrar(self, nodos, internas, grados):
+        cid = self.siguiente_id
+        self.siguiente_id += 1
+        for nodo in nodos:
+            self.comunidad[nodo] = cid
+        self.internas[cid] = internas
+        self.grados[cid] = grados
+        self.total_internas += internas
+        self.total_cuadrados += grados * grados
+
+    def partir(self, parte_a, parte_b):
+        '''Actualiza Q cuando la comunidad de parte_a y parte_b se parte en esas dos.'''
+        chica = min(parte_a, parte_b, key=len)
+        cid = self.comunidad[next(iter(chica))]
+        internas_c, grados_c = self.internas.pop(cid), self.grados.pop(cid)
+        self.total_internas -= internas_c
+        self.total_cuadrados -= grados_c * grados_c
+        internas, grados, corte = self._contar(set(chica), cid)
+        self._registrar(chica, internas, grados)
+        # La parte grande conserva el id viejo: no hace falta reasignar sus nodos
+        internas_g = internas_c - internas - corte
+        grados_g = grados_c - grados
+        self.internas[cid] = internas_g
+        self.grados[cid] = grados_g
+        self.total_internas += internas_g
+        self.total_cuadrados += grados_g * grados_g
+
+    def valor(self):
+        if self.m == 0:
+            return 0.0
+        return self.total_internas / self.m - self.total_cuadrados / (4 * self.m * self.m)
+
+def girvan_newman_con_modularidad(G, procesos=1, gn=None, muestras=None, semilla=0):
+    '''Como girvan_newman_incremental, pero cada nivel viene con su modularidad en G.
+
+    Devuelve pares (comunidades, modularidad); la modularidad coincide con
+    nx.community.modularity(G, comunidades) y se actualiza con
+    ModularidadIncremental en tiempo proporcional a la parte chica de cada
+    división. Se puede pasar un GirvanNewman ya armado (por ejemplo uno
+    retomado de un punto de control) en `gn`; `muestras` y `semilla` pasan
+    a GirvanNewman para estimar la intermediación con fuentes al azar.
+    '''
+    if G.number_of_edges() == 0:
+        comunidades = tuple(nx.connected_components(G))
+        yield comunidades, ModularidadIncremental(G, comunidades).valor()
+        return
+    gn = gn or GirvanNewman(G, procesos, muestras=muestras, semilla=semilla)
+    modularidad = ModularidadIncremental(G, gn.comunidades())
+    while gn.g.number_of_edges() > 0:
+        comunidades = gn.dividir()
+        modularidad.partir(*gn.ultima_division)
+        yield comunidades, modularidad.valor()
+
+def girvan_newman_incremental(G, procesos=1):
+    '''Mismo generador que nx.community.girvan_newman, con GirvanNewman por debajo.'''
+    if G.number_of_edges() == 0:
+        yield tuple(nx.connected_components(G))
+        return
+    gn = GirvanNewman(G, procesos)
+    while gn.g.number_of_edges() > 0:
+        yield gn.dividir()
+
+
+# -------------------------------
+# Dendrograma
+# -------------------------------
+class Dendrograma:
+    '''Jerarquía de Girvan-Newman guardada como eventos de división.
+
+    Cada comunidad es un id entero. El nivel 0 es la partición inicial (las
+    componentes de G, ids 0..c0-1) y el nivel k resulta de la k-ésima
+    división, que parte la comunidad `padre` en dos nuevas, `a` y `b`; las
+    divisiones quedan en `eventos`, un arreglo (k, 4) de (padre, a, b, nivel).
+    `hojas` da para cada nodo (por su posición en `nodos`) la comunidad en
+    el último nivel registrado. Con eso la partición de cualquier nivel sale
+    en O(N) sin volver a correr el algoritmo.
+    '''
+
+    def __init__(self, nodos, iniciales, eventos=None, hojas=None, modularidades=()):
+        self.nodos = list(nodos)
+        self.posicion = {nodo: i for i, nodo in enumerate(self.nodos)}
+        iniciales = np.asarray(iniciales, dtype=np.int64)
+        self.raices = int(iniciales.max()) + 1 if len(iniciales) else 0
+        self.hojas = iniciales.copy() if hojas is None else np.asarray(hojas, dtype=np.int64).copy()
+        eventos = np.empty((0, 4), dtype=np.int64) if eventos is None else np.asarray(eventos, dtype=np.int64)
+        self.lista_eventos = [tuple(e) for e in eventos.tolist()]
+        self.modularidades = [float(q) for q in modularidades]
+        self._arreglos = None
+
+    @classmethod
+    def desde_comunidades(cls, comunidades, nodos, G=None):
+        '''Dendrograma de un solo nivel a partir de la partición inicial.
+
+        Con G se guarda también la modularidad del nivel 0, así
+        modularidades[k] es la del nivel k.
+        '''
+        nodos = list(nodos)
+        etiquetas = etiquetas_de(comunidades, {nodo: i for i, nodo in enumerate(nodos)})
+        modularidades = () if G is None else (ModularidadIncremental(G, comunidades).valor(),)
+        return cls(nodos, etiquetas, modularidades=modularidades)
+
+    @property
+    def niveles(self):
+        return len(self.lista_eventos)
+
+    @property
+    def eventos(self):
+        return np.array(self.lista_eventos, dtype=np.int64).reshape(-1, 4)
+
+    def partir(self, parte_a, parte_b, modularidad=None):
+        '''Registra la división de la comunidad de parte_a y parte_b en esas dos.'''
+        pos_a = [self.posicion[n] for n in parte_a]
+        pos_b = [self.posicion[n] for n in parte_b]
+        padre = int(self.hojas[pos_a[0]])
+        a = self.raices + 2 * len(self.lista_eventos)
+        self.hojas[pos_a] = a
+        self.hojas[pos_b] = a + 1
+        self.lista_eventos.append((padre, a, a + 1, len(self.lista_eventos) + 1))
+        if modularidad is not None:
+            self.modularidades.append(float(modularidad))
+        self._arreglos = None
+
+    def _padres(self):
+        '''Padre y nivel de creación de cada id, y la tabla de saltos 2^j hacia arriba.'''
+        if self._arreglos is None:
+            total = self.raices + 2 * len(self.lista_eventos)
+            padre = np.arange(total, dtype=np.int64)
+            creado = np.zeros(total, dtype=np.int64)
+            eventos = self.eventos
+            padre[eventos[:, 1]] = padre[eventos[:, 2]] = eventos[:, 0]
+            creado[eventos[:, 1]] = creado[eventos[:, 2]] = eventos[:, 3]
+            saltos = [padre]
+            while len(saltos) < max(1, int(total).bit_length()):
+                saltos.append(saltos[-1][saltos[-1]])
+            self._arreglos = padre, creado, saltos
+        return self._arreglos
+
+    def _validar(self, nivel):
+        if not 0 <= nivel <= self.niveles:
+            raise ValueError(f"nivel debe estar entre 0 y {self.niveles}, no {nivel}")
+
+    def etiquetas_en(self, nivel):
+        '''Id de la comunidad de cada nodo (por posición) en ese nivel, en O(N).'''
+        self._validar(nivel)
+        arriba = list(range(self.raices + 2 * self.niveles))
+        # Cada id nace después que su padre: repasando en orden las divisiones
+        # posteriores al nivel, el padre ya tiene su comunidad de ese nivel
+        for padre, a, b, _ in self.lista_eventos[nivel:]:
+            arriba[a] = arriba[b] = arriba[padre]
+        return np.array(arriba, dtype=np.int64)[self.hojas]
+
+    def comunidades_en(self, nivel):
+        '''Partición del nivel como tupla de listas ordenadas, igual que la que guardan los scripts.
+
+        Las comunidades van en el orden de nx.connected_components (por la
+        posición de su primer nodo), no en el de sus ids.
+        '''
+        _, primeras, etiquetas = np.unique(self.etiquetas_en(nivel), return_index=True, return_inverse=True)
+        rango = np.empty(len(primeras), dtype=np.int64)
+        rango[np.argsort(primeras)] = np.arange(len(primeras))
+        return comunidades_de(rango[etiquetas], self.nodos)
+
+    def comunidad_de(self, nodo, nivel):
+        '''Id de la comunidad del nodo en ese nivel, en O(log N) subiendo por saltos.'''
+        self._validar(nivel)
+        padre, creado, saltos = self._padres()
+        c = int(self.hojas[self.posicion[nodo]])
+        if creado[c] <= nivel:
+            return c
+        for salto in reversed(saltos):
+            if creado[salto[c]] > nivel:
+                c = int(salto[c])
+        return int(padre[c])
+
+    def miembros(self, comunidad, nivel):
+        '''Nodos de la comunidad (un id vivo en ese nivel).'''
+        etiquetas = self.etiquetas_en(nivel)
+        return [self.nodos[i] for i in np.flatnonzero(etiquetas == comunidad)]
+
+    def mejor_nivel(self):
+        '''Nivel de modularidad máxima (el primero, ante empates).'''
+        return int(np.argmax(self.modularidades))
+
+    def guardar(self, archivo):
+        temporal = archivo + '.tmp'
+        with open(temporal, 'wb') as f:
+            np.savez_compressed(f, **self.arreglos())
+        os.replace(temporal, archivo)
+
+    def arreglos(self):
+        '''Arreglos con que se reconstruye el dendrograma (ver leer).'''
+        iniciales = self.etiquetas_en(0) if self.niveles else self.hojas
+        return {'nodos': np.asarray(self.nodos), 'iniciales': iniciales, 'hojas': self.hojas,
+                'eventos': self.eventos, 'modularidades': np.array(self.modularidades, dtype=float)}
+
+    @classmethod
+    def desde_arreglos(cls, arreglos):
+        return cls(arreglos['nodos'].tolist(), arreglos['iniciales'], arreglos['eventos'], arreglos['hojas'],
+                   arreglos['modularidades'])
+
+    @classmethod
+    def leer(cls, archivo):
+        with np.load(archivo) as datos:
+            return cls.desde_arreglos(datos)
+
+
+# -------------------------------
+# Puntos de control
+# -------------------------------
+def guardar_punto_de_control(archivo, gn, dendrograma=None, **estado):
+    '''Guarda las aristas sacadas (como rangos) y el estado escalar del bucle en un .npz.
+
+    Se escribe en un temporal y se renombra, así un corte a mitad de la
+    escritura deja el punto de control anterior intacto. Si se pasa el
+    Dendrograma va en el mismo archivo, consistente con las aristas sacadas.
+    '''
+    if dendrograma is not None:
+        estado.update({'dendrograma_' + clave: valor for clave, valor in dendrograma.arreglos().items()})
+    temporal = archivo + '.tmp'
+    with open(temporal, 'wb') as f:
+        np.savez_compressed(f, removidas=np.array(gn.removidas, dtype=np.int64),
+                            aristas=len(gn.arista), muestras=gn.muestras or 0, semilla=gn.semilla, **estado)
+    os.replace(temporal, archivo)
+
+def leer_punto_de_control(archivo, G, procesos=1):
+    '''Devuelve el GirvanNewman retomado y el estado guardado con guardar_punto_de_control.'''
+    with np.load(archivo) as datos:
+        estado = {clave: datos[clave] for clave in datos.files}
+    removidas = estado.pop('removidas')
+    aristas = int(estado.pop('aristas'))
+    muestras = int(estado.pop('muestras', 0)) or None
+    semilla = int(estado.pop('semilla', 0))
+    partes = {clave[len('dendrograma_'):]: estado.pop(clave) for clave in list(estado)
+              if clave.startswith('dendrograma_')}
+    if partes:
+        estado['dendrograma'] = Dendrograma.desde_arreglos(partes)
+    gn = GirvanNewman(G, procesos, removidas=removidas, muestras=muestras, semilla=semilla)
+    if len(gn.arista) != aristas:
+        raise ValueError(f"El punto de control '{archivo}' es de otro grafo ({aristas} aristas).")
+    return gn, estado
+
+def etiquetas_de(comunidades, posicion):
+    '''Partición como arreglo: etiqueta de comunidad de cada nodo según su posición.'''
+    etiquetas = np.empty(len(posicion), dtype=np.int32)
+    for k, comunidad in enumerate(comunidades):
+        for nodo in comunidad:
+            etiquetas[posicion[nodo]] = k
+    return etiquetas
+
+def comunidades_de(etiquetas, nodos):
+    '''Inversa de etiquetas_de: tupla de listas ordenadas, una por etiqueta.'''
+    comunidades = [[] for _ in range(int(etiquetas.max()) + 1 if len(etiquetas) else 0)]
+    for nodo, k in zip(nodos, etiquetas.tolist()):
+        comunidades[k].append(nodo)
+    return tuple(sorted(c) for c in comunidades)
+
+
+# -------------------------------
+# Corrida con puntos de control
+# -------------------------------
+def opciones_girvan_newman(descripcion):
+    '''Opciones de línea de comandos comunes a girvan_newman_*.py.'''
+    parser = argparse.ArgumentParser(description=descripcion)
+    parser.add_argument('--resume', action='store_true', help="retomar desde el último punto de control")
+    parser.add_argument('--cada', type=int, default=25, help="niveles entre puntos de control")
+    parser.add_argument('--paciencia', type=int, default=None,
+                        help="cortar después de K niveles seguidos en que baja la modularidad")
+    parser.add_argument('--comunidades', type=int, default=None,
+                        help="cortar al llegar a esta cantidad de comunidades")
+    parser.add_argument('--muestras', type=int, default=None,
+                        help="estimar la intermediación de aristas con K fuentes al azar por componente")
+    parser.add_argument('--semilla', type=int, default=0, help="semilla del muestreo de fuentes")
+    return parser
+
+def correr_girvan_newman(G, nombre, resume=False, cada=25, paciencia=None, comunidades=None,
+                         muestras=None, semilla=0, procesos=None):
+    '''Girvan-Newman completo sobre G con las salidas de los scripts girvan_newman_*.py.
+
+    Escribe modularidad_por_iteracion_<sufijo>.csv, best_partition_<sufijo>.pkl,
+    girvan_newman_<sufijo>_checkpoint.npz (cada `cada` niveles) y
+    dendrograma_<sufijo>.npz, con sufijo = nombre (o nombre_k<muestras> si la
+    intermediación es muestreada, así no pisa la corrida exacta). Con resume
+    retoma desde el punto de control; corta antes si la modularidad baja
+    `paciencia` niveles seguidos o si se llega a `comunidades` comunidades.
+    Devuelve (mejor_iter, mod_max, com_max).
+    '''
+    sufijo = f"{nombre}_k{muestras}" if muestras else nombre
+    csv_file = f"modularidad_por_iteracion_{sufijo}.csv"
+    checkpoint_file = f"girvan_newman_{sufijo}_checkpoint.npz"
+    best_file = f"best_partition_{sufijo}.pkl"
+    dendrograma_file = f"dendrograma_{sufijo}.npz"
+    procesos = procesos or os.cpu_count()
+
+    if resume and os.path.isfile(checkpoint_file):
+        print(f"Retomando desde '{checkpoint_file}'...")
+        gn, estado = leer_punto_de_control(checkpoint_file, G, procesos=procesos)
+        paso = int(estado['paso'])
+        mod_max = float(estado['mod_max'])
+        mejor_iter = int(estado['mejor_iter'])
+        declives = int(estado['declives'])
+        anterior = float(estado['anterior'])
+        dendrograma = estado['dendrograma']
+        com_max = dendrograma.comunidades_en(mejor_iter) if mejor_iter else None
+        # Los niveles posteriores al punto de control se vuelven a calcular
+        with open(csv_file) as f:
+            filas = f.readlines()
+        with open(csv_file, "w") as f:
+            f.writelines(filas[:paso + 1])
+        print(f"Iteración {paso}, mejor modularidad hasta ahora: {mod_max:.4f}")
+    else:
+        gn = GirvanNewman(G, procesos=procesos, muestras=muestras, semilla=semilla)
+        # Jerarquía completa: un evento (padre, a, b, nivel) por división
+        dendrograma = Dendrograma.desde_comunidades(gn.comunidades(), gn.g, G)
+        paso = 0
+        mod_max = -999
+        com_max = None
+        mejor_iter = 0
+        declives = 0
+        anterior = -999
+        with open(csv_file, "w") as f:
+            f.write("iteracion,comunidades,modularidad\n")
+
+    print("Ejecutando algoritmo Girvan-Newman...")
+    # Misma secuencia que nx.community.girvan_newman, recalculando solo la componente partida;
+    # la modularidad de cada nivel se actualiza con la división en lugar de recalcularse
+    modulos = girvan_newman_con_modularidad(G, gn=gn)
+    for step, (communities, n_modularidad) in enumerate(modulos, start=paso + 1):
+        print(f"Iteración {step}")
+        n_comunidades = len(communities)
+        print(f"Modularidad = {n_modularidad:.4f} | Comunidades: {n_comunidades}")
+
+        dendrograma.partir(*gn.ultima_division, modularidad=n_modularidad)
+
+        # Guardar evolución en CSV
+        with open(csv_file, "a") as f:
+            f.write(f"{step},{n_comunidades},{n_modularidad:.6f}\n")
+
+        # Guardar mejor partición
+        if n_modularidad > mod_max:
+            mod_max = n_modularidad
+            com_max = tuple(sorted(c) for c in communities)
+            mejor_iter = step
+            with open(best_file, "wb") as f:
+                pickle.dump({
+                    "iter": mejor_iter,
+                    "modularity": mod_max,
+                    "partition": com_max
+                }, f)
+            print(f"Partición guardada: iteración {step}, modularidad = {mod_max:.4f}")
+
+        # Criterios de parada
+        declives = declives + 1 if n_modularidad < anterior else 0
+        anterior = n_modularidad
+        parar = None
+        if paciencia and declives >= paciencia:
+            parar = f"la modularidad bajó {declives} niveles seguidos"
+        elif comunidades and n_comunidades >= comunidades:
+            parar = f"se llegó a {n_comunidades} comunidades"
+
+        if step % cada == 0 or parar:
+            guardar_punto_de_control(checkpoint_file, gn, dendrograma, paso=step, mod_max=mod_max,
+                                     mejor_iter=mejor_iter, declives=declives, anterior=anterior)
+            print(f"Punto de control guardado: iteración {step}")
+        if parar:
+            print(f"Corte anticipado: {parar}.")
+            break
+    modulos.close()
+    dendrograma.guardar(dendrograma_file)
+
+    print("\nProceso completado.")
+    print(f"Mejor partición en la iteración {mejor_iter} con modularidad: {mod_max:.4f}")
+    print(f"Número de comunidades: {len(com_max)}")
+    print(f"Histórico guardado en: {csv_file}")
+    print(f"Dendrograma guardado en: {dendrograma_file} ({dendrograma.niveles} niveles)")
+    return mejor_iter, mod_max, com_max
+
+
+# -------------------------------
+# Comparación de particiones
+# -------------------------------
+def _contingencia(etiquetas_a, etiquetas_b):
+    _, a = np.unique(etiquetas_a, return_inverse=True)
+    _, b = np.unique(etiquetas_b, return_inverse=True)
+    tabla = np.zeros((a.max() + 1, b.max() + 1))
+    np.add.at(tabla, (a, b), 1)
+    return tabla
+
+def _pares(cantidades):
+    return (cantidades * (cantidades - 1) / 2).sum()
+
+def informacion_mutua_normalizada(etiquetas_a, etiquetas_b):
+    '''NMI con normalización por la media aritmética de las entropías (la de sklearn por defecto).'''
+    tabla = _contingencia(etiquetas_a, etiquetas_b)
+    n = tabla.sum()
+    p_a, p_b = tabla.sum(axis=1) / n, tabla.sum(axis=0) / n
+    h_a, h_b = -(p_a @ np.log(p_a)), -(p_b @ np.log(p_b))
+    if h_a == 0 and h_b == 0:
+        return 1.0
+    conjunta = tabla[tabla > 0] / n
+    filas, columnas = np.nonzero(tabla)
+    mutua = conjunta @ np.log(conjunta / (p_a[filas] * p_b[columnas]))
+    return float(mutua / ((h_a + h_b) / 2))
+
+def indice_rand_ajustado(etiquetas_a, etiquetas_b):
+    '''ARI de Hubert y Arabie a partir de la tabla de contingencia.'''
+    tabla = _contingencia(etiquetas_a, etiquetas_b)
+    total = _pares(np.array([tabla.sum()]))
+    indice = _pares(tabla)
+    filas, columnas = _pares(tabla.sum(axis=1)), _pares(tabla.sum(axis=0))
+    esperado = filas * columnas / total if total else 0
+    maximo = (filas + columnas) / 2
+    if maximo == esperado:
+        return 1.0
+    return float((indice - esperado) / (maximo - esperado))
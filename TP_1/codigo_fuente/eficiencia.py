@@ -0,0 +1,421 @@
+"""Eficiencia global incremental y muestreada bajo remoción de nodos, y BFS bit-paralelo."""
+import math
+from collections import deque
+
+import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+
+
+# -------------------------------
+# BFS sobre índices
+# -------------------------------
+def indexar(G):
+    '''Nodos de G, su índice y la lista de vecinos por índice (sin lazos).'''
+    nodos = list(G)
+    indice = {nodo: i for i, nodo in enumerate(nodos)}
+    vecinos = [{indice[w] for w in G[nodo] if w != nodo} for nodo in nodos]
+    return nodos, indice, vecinos
+
+def bfs_distancias(vecinos, fuente, n):
+    '''Fila de distancias desde fuente (-1 para los nodos no alcanzables).'''
+    fila = np.full(n, -1, dtype=np.int32)
+    alcanzados = [fuente]
+    distancias = [0]
+    dist = {fuente: 0}
+    cola = deque([fuente])
+    while cola:
+        u = cola.popleft()
+        d = dist[u] + 1
+        for w in vecinos[u]:
+            if w not in dist:
+                dist[w] = d
+                alcanzados.append(w)
+                distancias.append(d)
+                cola.append(w)
+    fila[alcanzados] = distancias
+    return fila
+
+def fuentes_afectadas(D, vecinos, v):
+    '''Filas de D (una por fuente) cuyas distancias cambian al eliminar v.
+
+    Son las fuentes en cuyo árbol de caminos mínimos v es el único padre de
+    algún vecino w; si todo hijo de v tiene otro padre en el mismo nivel,
+    las distancias no cambian salvo la del propio v.
+    '''
+    hasta_v = D[:, v]
+    afectadas = np.zeros(len(D), dtype=bool)
+    alcanzan = hasta_v > 0
+    for w in vecinos[v]:
+        hijos = np.flatnonzero(alcanzan & (D[:, w] == hasta_v + 1))
+        if len(hijos) == 0:
+            continue
+        otros = [u for u in vecinos[w] if u != v]
+        if otros:
+            nivel = hasta_v[hijos][:, None]
+            con_otro_padre = (D[np.ix_(hijos, otros)] == nivel).any(axis=1)
+            hijos = hijos[~con_otro_padre]
+        afectadas[hijos] = True
+    return afectadas
+
+def orden_de_pivotes(G, semilla=None):
+    '''Permutación aleatoria de los nodos de G que fija la prioridad de los pivotes.'''
+    nodos = list(G)
+    return [nodos[i] for i in np.random.default_rng(semilla).permutation(len(nodos))]
+
+def desconectar(vecinos, v):
+    for w in vecinos[v]:
+        vecinos[w].discard(v)
+    vecinos[v] = set()
+
+
+# -------------------------------
+# Eficiencia incremental
+# -------------------------------
+class EficienciaIncremental:
+    '''Sigue nx.global_efficiency(G) mientras se eliminan nodos de G.
+
+    Guarda la matriz de distancias entre todos los pares (N x N, int32) y un
+    histograma con la cantidad de pares ordenados a cada distancia. Al
+    eliminar un nodo v solo se repite el BFS de las fuentes afectadas (ver
+    fuentes_afectadas); para el resto alcanza con descontar el par (s, v).
+
+    En un ataque dirigido sacar un hub afecta a casi todas las fuentes y
+    repetir sus BFS cuesta más que recalcular todo. Si las afectadas superan
+    `umbral` de los nodos que quedan, sus filas quedan sucias (fuera del
+    histograma) y su aporte se calcula de cero con el BFS bit-paralelo
+    (sumas_de_distancias); una fila sucia cuenta como afectada en los pasos
+    siguientes y se vuelve a recorrer con BFS recién cuando las afectadas
+    bajan del umbral. Del BFS bit-paralelo sale el histograma de distancias
+    de esas filas, así que el valor es el mismo que sin el atajo.
+
+    Uso dentro de simular_robustez:
+
+        eficiencia = EficienciaIncremental(G)
+        ...
+        G.remove_node(nodo)
+        eficiencia.eliminar(nodo)
+        ...
+        eficiencias.append(eficiencia.valor())
+    '''
+
+    def __init__(self, G, umbral=0.1):
+        self.nodos, self.indice, self.vecinos = indexar(G)
+        n = len(self.nodos)
+        self.activos = n
+        self.umbral = umbral
+        self.D = np.empty((n, n), dtype=np.int32)
+        self.histograma = np.zeros(n + 1, dtype=np.int64)
+        for s in range(n):
+            self.D[s] = bfs_distancias(self.vecinos, s, n)
+            self.histograma += self._conteo(self.D[s])
+        self.sucias = np.zeros(n, dtype=bool)
+        self.histograma_sucias = np.zeros(n + 1, dtype=np.int64)
+
+    def _conteo(self, distancias):
+        return np.bincount(distancias[distancias > 0], minlength=len(self.histograma))
+
+    def _adyacencia(self):
+        filas = np.repeat(np.arange(len(self.vecinos)), [len(w) for w in self.vecinos])
+        columnas = np.fromiter((w for ws in self.vecinos for w in ws), dtype=np.int64, count=len(filas))
+        n = len(self.nodos)
+        return sp.csr_array((np.ones(len(filas), dtype=np.int8), (filas, columnas)), shape=(n, n))
+
+    def eliminar(self, nodo):
+        v = self.indice.get(nodo)
+        if v is None or self.D[v, v] < 0:
+            return
+        n = len(self.nodos)
+        hasta_v = self.D[:, v].copy()
+        limpias = ~self.sucias
+        afectadas = fuentes_afectadas(self.D, self.vecinos, v) | self.sucias
+        afectadas[v] = False
+
+        # Se descuentan las filas limpias que se recalculan, los pares (s, v)
+        # del resto de las fuentes y la fila completa de v
+        for s in np.flatnonzero(afectadas & limpias):
+            self.histograma -= self._conteo(self.D[s])
+        sueltos = hasta_v[~afectadas & limpias & (hasta_v > 0)]
+        self.histograma -= np.bincount(sueltos, minlength=n + 1)
+        if limpias[v]:
+            self.histograma -= self._conteo(self.D[v])
+
+        desconectar(self.vecinos, v)
+        self.D[v, :] = -1
+        self.D[:, v] = -1
+        self.activos -= 1
+
+        fuentes = np.flatnonzero(afectadas)
+        if len(fuentes) > self.umbral * self.activos:
+            self.sucias = afectadas
+            self.histograma_sucias = np.zeros(n + 1, dtype=np.int64)
+            sumas_de_distancias(self._adyacencia(), fuentes, histograma=self.histograma_sucias)
+            return
+        for s in fuentes:
+            self.D[s] = bfs_distancias(self.vecinos, s, n)
+            self.histograma += self._conteo(self.D[s])
+        self.sucias = np.zeros(n, dtype=bool)
+        self.histograma_sucias = np.zeros(n + 1, dtype=np.int64)
+
+    def valor(self):
+        '''Eficiencia global actual, como nx.global_efficiency.'''
+        n = self.activos
+        denom = n * (n - 1)
+        if denom == 0:
+            return 0
+        d = np.arange(1, len(self.histograma))
+        return float(((self.histograma + self.histograma_sucias)[1:] / d).sum() / denom)
+
+
+# -------------------------------
+# Eficiencia muestreada
+# -------------------------------
+class EficienciaMuestreada:
+    '''Estimación de la eficiencia global a partir de k pivotes BFS.
+
+    Los pivotes son los primeros k nodos presentes de una permutación
+    aleatoria fija, así que se mantienen entre pasos (números aleatorios
+    comunes) y la curva estimada no salta de un paso al siguiente. Cuando se
+    elimina un pivote se reemplaza por el siguiente nodo presente de la
+    permutación. Las filas de distancias de los pivotes se actualizan igual
+    que en EficienciaIncremental.
+
+    La permutación es orden_de_pivotes(G, semilla); para estimar sobre un
+    subgrafo con los mismos pivotes se puede pasar el orden del grafo
+    original en `orden` (los nodos que ya no están se saltean).
+    '''
+
+    def __init__(self, G, pivotes=64, semilla=None, orden=None):
+        self.nodos, self.indice, self.vecinos = indexar(G)
+        n = len(self.nodos)
+        self.activos = n
+        self.presente = np.ones(n, dtype=bool)
+        if orden is None:
+            orden = orden_de_pivotes(G, semilla)
+        self.orden = np.array([self.indice[x] for x in orden if x in self.indice], dtype=int)
+        self.siguiente = 0
+        k = min(pivotes, n)
+        self.pivotes = np.full(k, -1)
+        self.D = np.full((k, n), -1, dtype=np.int32)
+        self.sumas = np.zeros(k)
+        for r in range(k):
+            self._reponer(r)
+
+    def _reponer(self, r):
+        n = len(self.orden)
+        while self.siguiente < n and not self.presente[self.orden[self.siguiente]]:
+            self.siguiente += 1
+        if self.siguiente == n:
+            self.pivotes[r] = -1
+            self.D[r] = -1
+            self.sumas[r] = 0
+            return
+        self.pivotes[r] = self.orden[self.siguiente]
+        self.siguiente += 1
+        self._recalcular(r)
+
+    def _recalcular(self, r):
+        self.D[r] = bfs_distancias(self.vecinos, self.pivotes[r], len(self.nodos))
+        d = self.D[r][self.D[r] > 0]
+        self.sumas[r] = (1 / d).sum()
+
+    def eliminar(self, nodo):
+        v = self.indice.get(nodo)
+        if v is None or not self.presente[v]:
+            return
+        hasta_v = self.D[:, v].copy()
+        afectadas = fuentes_afectadas(self.D, self.vecinos, v)
+
+        desconectar(self.vecinos, v)
+        self.presente[v] = False
+        self.activos -= 1
+        self.D[:, v] = -1
+
+        sueltos = ~afectadas & (hasta_v > 0)
+        self.sumas[sueltos] -= 1 / hasta_v[sueltos]
+        for r in np.flatnonzero(afectadas):
+            self._recalcular(r)
+        for r in np.flatnonzero(self.pivotes == v):
+            self._reponer(r)
+
+    def valor(self):
+        '''Estimación de la eficiencia global y su error estándar.'''
+        n = self.activos
+        usados = self.pivotes >= 0
+        k = int(usados.sum())
+        if n < 2 or k == 0:
+            return 0, 0
+        x = self.sumas[usados] / (n - 1)
+        if k == 1:
+            return float(x[0]), float('nan')
+        # Corrección por población finita: con k = n el error es 0
+        error = x.std(ddof=1) / np.sqrt(k) * np.sqrt((n - k) / (n - 1))
+        return float(x.mean()), float(error)
+
+
+# -------------------------------
+# Eficiencia por componentes (cola de la simulación)
+# -------------------------------
+def _componentes(vecinos, nodos):
+    '''Componentes conexas del subconjunto `nodos` según la adyacencia vecinos.'''
+    pendientes = set(nodos)
+    while pendientes:
+        inicio = pendientes.pop()
+        componente = {inicio}
+        cola = deque([inicio])
+        while cola:
+            u = cola.popleft()
+            for w in vecinos[u]:
+                if w not in componente:
+                    componente.add(w)
+                    cola.append(w)
+        pendientes -= componente
+        yield componente
+
+class EficienciaPorComponentes:
+    '''Eficiencia global exacta como suma de los aportes de cada componente conexa.
+
+    Sirve para la cola de la simulación, cuando ya no queda componente
+    gigante: al eliminar un nodo solo se recalcula, con BFS, la componente
+    que lo contenía, que es chica. También da el tamaño de la componente
+    más grande para seguir la curva Ng/N.
+    '''
+
+    def __init__(self, G):
+        self.vecinos = {n: {w for w in G[n] if w != n} for n in G}
+        self.componente = {}
+        self.miembros = {}
+        self.aporte = {}
+        self.siguiente_id = 0
+        for componente in _componentes(self.vecinos, self.vecinos):
+            self._agregar(componente)
+
+    def _agregar(self, nodos):
+        cid = self.siguiente_id
+        self.siguiente_id += 1
+        suma = 0.0
+        if len(nodos) > 1:
+            for fuente in nodos:
+                dist = {fuente: 0}
+                cola = deque([fuente])
+                while cola:
+                    u = cola.popleft()
+                    for w in self.vecinos[u]:
+                        if w not in dist:
+                            dist[w] = dist[u] + 1
+                            suma += 1 / dist[w]
+                            cola.append(w)
+        for nodo in nodos:
+            self.componente[nodo] = cid
+        self.miembros[cid] = nodos
+        self.aporte[cid] = suma
+
+    def eliminar(self, nodo):
+        if nodo not in self.vecinos:
+            return
+        cid = self.componente.pop(nodo)
+        nodos = self.miembros.pop(cid)
+        del self.aporte[cid]
+        nodos.discard(nodo)
+        for w in self.vecinos.pop(nodo):
+            self.vecinos[w].discard(nodo)
+        for componente in _componentes(self.vecinos, nodos):
+            self._agregar(componente)
+
+    def gigante(self):
+        return max((len(m) for m in self.miembros.values()), default=0)
+
+    def valor(self):
+        n = len(self.vecinos)
+        denom = n * (n - 1)
+        if denom == 0:
+            return 0
+        # fsum sobre las componentes: sin el error acumulado de sumar y restar
+        return math.fsum(self.aporte.values()) / denom
+
+
+# -------------------------------
+# BFS bit-paralelo
+# -------------------------------
+def _bits_por_fuente(bloque, ancho):
+    '''Cantidad de nodos con el bit j prendido, para cada fuente j del bloque.'''
+    bits = np.unpackbits(bloque.view(np.uint8), axis=1, bitorder='little')
+    return bits.sum(axis=0, dtype=np.int64)[:ancho]
+
+def sumas_de_distancias(A, fuentes=None, palabras=4, histograma=None):
+    '''Por cada fuente: nodos alcanzados, suma de distancias y suma de 1/d.
+
+    A es la adyacencia (A[u, v] != 0 si hay arista u -> v). Avanza
+    64 * palabras fuentes a la vez: cada nodo guarda un bit por fuente
+    en palabras de 64 bits y un nivel del BFS es un OR de las fronteras de
+    sus predecesores (np.bitwise_or.reduceat sobre el CSR de la
+    traspuesta) seguido de sacar los ya visitados. Las distancias no se guardan; solo las sumas que
+    necesitan cercanía, eficiencia global y longitud media de caminos. Si se
+    pasa `histograma`, se le suma la cantidad de pares (fuente, nodo) a cada
+    distancia.
+    '''
+    # Cada fila de la traspuesta lista los predecesores del nodo
+    A = sp.csr_array(sp.csr_array(A).T)
+    n = A.shape[0]
+    fuentes = np.arange(n) if fuentes is None else np.asarray(fuentes)
+    indptr, indices = A.indptr, A.indices
+    con_vecinos = np.diff(indptr) > 0
+    inicios = indptr[:-1][con_vecinos]
+    alcanzados = np.zeros(len(fuentes), dtype=np.int64)
+    suma_distancias = np.zeros(len(fuentes))
+    suma_inversas = np.zeros(len(fuentes))
+    if n == 0 or len(indices) == 0:
+        return alcanzados, suma_distancias, suma_inversas
+
+    por_bloque = 64 * palabras
+    for inicio in range(0, len(fuentes), por_bloque):
+        bloque = fuentes[inicio:inicio + por_bloque]
+        ancho = len(bloque)
+        j = np.arange(ancho)
+        frontera = np.zeros((n, palabras), dtype=np.uint64)
+        np.bitwise_or.at(frontera, (bloque, j // 64), np.left_shift(np.uint64(1), (j % 64).astype(np.uint64)))
+        visitados = frontera.copy()
+        d = 0
+        while True:
+            d += 1
+            nueva = np.zeros_like(frontera)
+            nueva[con_vecinos] = np.bitwise_or.reduceat(frontera[indices], inicios, axis=0)
+            nueva &= ~visitados
+            if not nueva.any():
+                break
+            visitados |= nueva
+            frontera = nueva
+            cantidad = _bits_por_fuente(nueva, ancho)
+            alcanzados[inicio:inicio + ancho] += cantidad
+            suma_distancias[inicio:inicio + ancho] += d * cantidad
+            suma_inversas[inicio:inicio + ancho] += cantidad / d
+            if histograma is not None:
+                histograma[d] += cantidad.sum()
+    return alcanzados, suma_distancias, suma_inversas
+
+def _sin_lazos(G):
+    A = nx.to_scipy_sparse_array(G, weight=None, dtype=np.int8, format='csr')
+    A.setdiag(0)
+    A.eliminate_zeros()
+    return A
+
+def eficiencia_global_bitparalela(G, palabras=4):
+    '''nx.global_efficiency con el BFS bit-paralelo.'''
+    n = len(G)
+    if n < 2:
+        return 0
+    _, _, suma_inversas = sumas_de_distancias(_sin_lazos(G), palabras=palabras)
+    return float(suma_inversas.sum() / (n * (n - 1)))
+
+def longitud_media_caminos(G, palabras=4):
+    '''nx.average_shortest_path_length (sin pesos) con el BFS bit-paralelo.'''
+    n = len(G)
+    if n == 0:
+        raise nx.NetworkXPointlessConcept("el grafo nulo no tiene caminos")
+    if n == 1:
+        return 0
+    alcanzados, suma_distancias, _ = sumas_de_distancias(_sin_lazos(G), palabras=palabras)
+    if np.any(alcanzados < n - 1):
+        tipo = "fuertemente conexo" if G.is_directed() else "conexo"
+        raise nx.NetworkXError(f"El grafo no es {tipo}.")
+    return float(suma_distancias.sum() / (n * (n - 1)))
@@ -0,0 +1,77 @@
+"""Comunidades por Louvain/Leiden con las mismas salidas que los scripts de Girvan-Newman.
+
+Escribe best_partition_<red>_<metodo>.pkl ({"iter", "modularity", "partition"})
+y modularidad_por_iteracion_<red>_<metodo>.csv, donde cada iteración es una
+pasada de agregación en lugar de una división.
+
+Uso: python ejecutar_louvain.py {facebook,aeropuertos} [--leiden] [--reinicios R] [--procesos P]
+"""
+import argparse
+import pickle
+import time
+
+import numpy as np
+
+from comunidades import comunidades_de
+from louvain import louvain_con_reinicios
+from redes import CARGADORES
+
+SUFIJOS = {'facebook': 'fb', 'aeropuertos': 'air'}
+ARCHIVOS = {'facebook': 'facebook.txt', 'aeropuertos': 'airport.txt'}
+
+
+# -------------------------------
+# Salidas
+# -------------------------------
+def guardar_niveles(nodos, niveles, csv_file, best_file):
+    '''CSV por nivel y pickle de la mejor partición, con el formato de girvan_newman_*.py.'''
+    mod_max, com_max, mejor_iter = -999, None, 0
+    with open(csv_file, "w") as f:
+        f.write("iteracion,comunidades,modularidad\n")
+        for step, (etiquetas, n_modularidad) in enumerate(niveles, start=1):
+            communities = comunidades_de(np.unique(etiquetas, return_inverse=True)[1], nodos)
+            f.write(f"{step},{len(communities)},{n_modularidad:.6f}\n")
+            if n_modularidad > mod_max:
+                mod_max, com_max, mejor_iter = n_modularidad, communities, step
+    with open(best_file, "wb") as f:
+        pickle.dump({
+            "iter": mejor_iter,
+            "modularity": mod_max,
+            "partition": com_max
+        }, f)
+    return mejor_iter, mod_max, com_max
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Louvain/Leiden con reinicios en paralelo.")
+    parser.add_argument('red', choices=sorted(CARGADORES))
+    parser.add_argument('--archivo', default=None, help="lista de aristas (por defecto la de la red)")
+    parser.add_argument('--leiden', action='store_true', help="refinar cada pasada como Leiden")
+    parser.add_argument('--reinicios', type=int, default=8)
+    parser.add_argument('--procesos', type=int, default=None)
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--resolucion', type=float, default=1)
+    args = parser.parse_args()
+
+    archivo = args.archivo or ARCHIVOS[args.red]
+    metodo = 'leiden' if args.leiden else 'louvain'
+    print(f"📥 Cargando red '{args.red}' desde '{archivo}'...")
+    G = CARGADORES[args.red](archivo)
+    print(f"Grafo cargado: {G.number_of_nodes()} nodos, {G.number_of_edges()} aristas.")
+
+    print(f"Ejecutando {metodo} con {args.reinicios} reinicios...")
+    t0 = time.perf_counter()
+    nodos, niveles, finales = louvain_con_reinicios(G, reinicios=args.reinicios, semilla=args.semilla,
+                                                    procesos=args.procesos, leiden=args.leiden,
+                                                    resolucion=args.resolucion)
+    print(f"Modularidad por reinicio: {' '.join(f'{q:.4f}' for q in finales)} ({time.perf_counter() - t0:.2f} s)")
+
+    sufijo = f"{SUFIJOS[args.red]}_{metodo}"
+    csv_file = f"modularidad_por_iteracion_{sufijo}.csv"
+    best_file = f"best_partition_{sufijo}.pkl"
+    mejor_iter, mod_max, com_max = guardar_niveles(nodos, niveles, csv_file, best_file)
+
+    print("\nProceso completado.")
+    print(f"Mejor partición en la iteración {mejor_iter} con modularidad: {mod_max:.4f}")
+    print(f"Número de comunidades: {len(com_max)}")
+    print(f"Histórico guardado en: {csv_file}")
@@ -0,0 +1,160 @@
+"""Barrido de robustez: todas las combinaciones red x estrategia en un solo proceso.
+
+Reemplaza a correr uno por uno los scripts simular_* y simulacion_*: cada red
+se carga y prepara una sola vez, cada centralidad se calcula una sola vez por
+red y se comparte entre las estrategias que la usan.
+
+Uso: python ejecutar_simulaciones.py [simulaciones.json]
+"""
+import contextlib
+import json
+import multiprocessing
+import os
+import pickle
+import sys
+
+import networkx as nx
+
+from ataques import ordenar_nodos
+from cache import centralidad_cacheada, precalcular_en_una_pasada
+from montecarlo import simular_montecarlo
+from redes import CARGADORES
+from robustez import simular_robustez
+
+# Estrategia -> centralidad que usa y nombre del pickle que escribían los scripts
+ESTRATEGIAS = {
+    'azar': (None, 'azar'),
+    'curiosa': ('grado', 'curiosa'),
+    'grado': ('grado', 'tradicional'),
+    'cercania': ('cercania', 'cercania'),
+    'intermediacion': ('intermediacion', 'intermediacion'),
+    'intermediacion_aproximada': ('intermediacion_aproximada', 'intermediacion_aproximada'),
+    'eigenvector': ('eigenvector', 'eigenvector'),
+    'pagerank': ('pagerank', 'pagerank'),
+}
+
+
+# -------------------------------
+# Configuración
+# -------------------------------
+def leer_configuracion(archivo):
+    with open(archivo) as f:
+        config = json.load(f)
+    config.setdefault('modo_ataque', 'estatico')
+    config.setdefault('realizaciones', 100)
+    config.setdefault('semilla', 0)
+    config.setdefault('procesos', 1)
+    config.setdefault('opciones', {})
+    config.setdefault('salida', os.path.dirname(os.path.abspath(archivo)))
+    for estrategia in config['estrategias']:
+        if estrategia not in ESTRATEGIAS:
+            raise ValueError(f"Estrategia desconocida: {estrategia!r} (opciones: {sorted(ESTRATEGIAS)})")
+    for red in config['redes'].values():
+        if red['tipo'] not in CARGADORES:
+            raise ValueError(f"Tipo de red desconocido: {red['tipo']!r} (opciones: {sorted(CARGADORES)})")
+    return config
+
+
+# -------------------------------
+# Preparación compartida
+# -------------------------------
+def preparar(config):
+    '''Carga cada red y calcula cada centralidad necesaria una sola vez.'''
+    necesarias = {ESTRATEGIAS[e][0] for e in config['estrategias']} - {None}
+    redes = {}
+    centralidades = {}
+    for nombre, red in config['redes'].items():
+        print(f"📥 Cargando red '{nombre}' desde '{red['archivo']}'...")
+        G = CARGADORES[red['tipo']](red['archivo'])
+        print(f"Grafo preparado: {G.number_of_nodes()} nodos, {G.number_of_edges()} aristas.")
+        redes[nombre] = G
+        centralidades[nombre] = {}
+        precalcular_en_una_pasada(G, necesarias)
+        for medida in sorted(necesarias):
+            print(f"📊 [{nombre}] Calculando centralidad: {medida}...")
+            try:
+                centralidades[nombre][medida] = centralidad_cacheada(G, medida)
+            except nx.PowerIterationFailedConvergence:
+                print(f"⚠️ [{nombre}] No convergió {medida}; se omiten sus estrategias.")
+    return redes, centralidades
+
+
+# -------------------------------
+# Ejecución
+# -------------------------------
+_compartido = {}
+
+def _iniciar_trabajador(redes, centralidades, config):
+    _compartido.update(redes=redes, centralidades=centralidades, config=config)
+
+def _correr_determinista(tarea):
+    nombre, estrategia = tarea
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        return correr(nombre, estrategia, _compartido['redes'], _compartido['centralidades'],
+                      _compartido['config'])
+
+def correr(nombre, estrategia, redes, centralidades, config):
+    '''Corre una combinación red x estrategia y guarda su pickle.'''
+    G = redes[nombre]
+    medida, sufijo = ESTRATEGIAS[estrategia]
+    centralidad = centralidades[nombre].get(medida)
+    salida = os.path.join(config['salida'], f'{nombre}_{sufijo}.pkl')
+
+    if estrategia in ('azar', 'curiosa'):
+        resultado = simular_montecarlo(
+            G, estrategia, config['realizaciones'], centralidad=centralidad,
+            semilla=config['semilla'], procesos=config['procesos'],
+            carpeta=os.path.join(config['salida'], f'{nombre}_{sufijo}_realizaciones'),
+            **config['opciones'])
+        datos = {'ngn': resultado['ngn']['media'].tolist(),
+                 'eff': resultado['eff']['media'].tolist(),
+                 'montecarlo': resultado}
+    else:
+        nodos = ordenar_nodos(G, centralidad, medida, modo=config['modo_ataque'])
+        curvas = simular_robustez(G, nodos, diagnosticos=True, **config['opciones'])
+        datos = {'ngn': curvas[0], 'eff': curvas[1], 'percolacion': curvas[-1]}
+
+    with open(salida, 'wb') as f:
+        pickle.dump(datos, f)
+    return salida
+
+def ejecutar(config):
+    os.makedirs(config['salida'], exist_ok=True)
+    redes, centralidades = preparar(config)
+    combinaciones = [
+        (nombre, estrategia)
+        for nombre in redes
+        for estrategia in config['estrategias']
+        if ESTRATEGIAS[estrategia][0] is None or ESTRATEGIAS[estrategia][0] in centralidades[nombre]
+    ]
+    # Las estocásticas ya reparten sus realizaciones en procesos
+    estocasticas = [c for c in combinaciones if c[1] in ('azar', 'curiosa')]
+    deterministas = [c for c in combinaciones if c not in estocasticas]
+
+    salidas = []
+    if config['procesos'] > 1 and len(deterministas) > 1:
+        contexto = multiprocessing.get_context('fork')
+        with contexto.Pool(min(config['procesos'], len(deterministas)),
+                           initializer=_iniciar_trabajador,
+                           initargs=(redes, centralidades, config)) as pool:
+            for salida in pool.imap_unordered(_correr_determinista, deterministas):
+                print(f"💾 Guardado: {salida}")
+                salidas.append(salida)
+    else:
+        for nombre, estrategia in deterministas:
+            print(f"🚀 [{nombre}] Simulando estrategia: {estrategia}...")
+            salidas.append(correr(nombre, estrategia, redes, centralidades, config))
+            print(f"💾 Guardado: {salidas[-1]}")
+
+    for nombre, estrategia in estocasticas:
+        print(f"🚀 [{nombre}] Simulando estrategia: {estrategia} ({config['realizaciones']} realizaciones)...")
+        salidas.append(correr(nombre, estrategia, redes, centralidades, config))
+        print(f"💾 Guardado: {salidas[-1]}")
+    return salidas
+
+
+if __name__ == '__main__':
+    archivo = sys.argv[1] if len(sys.argv) > 1 else 'simulaciones.json'
+    config = leer_configuracion(archivo)
+    salidas = ejecutar(config)
+    print(f"✅ Barrido completado: {len(salidas)} simulaciones.")
@@ -0,0 +1,216 @@
+"""Louvain (con refinamiento de Leiden opcional) sobre adyacencia en arreglos CSR."""
+import contextlib
+import multiprocessing
+import os
+from collections import deque
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+
+
+# -------------------------------
+# Adyacencia y modularidad
+# -------------------------------
+def matriz_de_modularidad(G):
+    '''Nodos de G y matriz B simétrica sin pesos, con los lazos contados dos veces.
+
+    Con B el grado es la suma de la fila y 2m la suma total, igual que en
+    nx.community.modularity(G, ..., weight=None); al agregar comunidades
+    (S^T B S) la diagonal sigue siendo el doble de las aristas internas.
+    '''
+    if nx.is_directed(G):
+        raise nx.NetworkXNotImplemented("Louvain se corre sobre la proyección no dirigida")
+    nodos = list(G)
+    A = nx.to_scipy_sparse_array(G, nodelist=nodos, weight=None, format='csr').astype(float)
+    A.data[:] = 1
+    B = (A + sparse.diags(A.diagonal())).tocsr()
+    return nodos, B
+
+def modularidad(B, etiquetas, resolucion=1):
+    '''Q = sum_c [in_c / 2m - resolucion (K_c / 2m)²] para la partición dada por etiquetas.'''
+    m2 = B.sum()
+    if m2 == 0:
+        return 0.0
+    coo = B.tocoo()
+    adentro = coo.data[etiquetas[coo.row] == etiquetas[coo.col]].sum()
+    K = np.bincount(etiquetas, weights=np.asarray(B.sum(axis=1)).ravel())
+    return float(adentro / m2 - resolucion * (K @ K) / (m2 * m2))
+
+
+# -------------------------------
+# Fases de una pasada
+# -------------------------------
+def _pesos_hacia(i, indptr, indices, datos, etiquetas):
+    '''Peso de las aristas de i hacia cada comunidad (sin contar el lazo).'''
+    pesos = {}
+    for p in range(indptr[i], indptr[i + 1]):
+        j = indices[p]
+        if j != i:
+            c = etiquetas[j]
+            pesos[c] = pesos.get(c, 0) + datos[p]
+    return pesos
+
+def _mover_nodos(indptr, indices, datos, k, etiquetas, m2, rng, resolucion):
+    '''Movimiento local con cola (como en Leiden): solo se revisitan los vecinos de un nodo que se movió.
+
+    Cambia etiquetas en el lugar y devuelve si algún nodo cambió de comunidad.
+    '''
+    n = len(k)
+    total = [0.0] * n
+    for i in range(n):
+        total[etiquetas[i]] += k[i]
+    cola = deque(rng.permutation(n).tolist())
+    en_cola = [True] * n
+    cambio = False
+    while cola:
+        i = cola.popleft()
+        en_cola[i] = False
+        actual = etiquetas[i]
+        pesos = _pesos_hacia(i, indptr, indices, datos, etiquetas)
+        total[actual] -= k[i]
+        factor = resolucion * k[i] / m2
+        mejor, ganancia = actual, pesos.get(actual, 0) - factor * total[actual]
+        for c, w in pesos.items():
+            g = w - factor * total[c]
+            if g > ganancia + 1e-12:
+                mejor, ganancia = c, g
+        total[mejor] += k[i]
+        if mejor != actual:
+            etiquetas[i] = mejor
+            cambio = True
+            for p in range(indptr[i], indptr[i + 1]):
+                j = indices[p]
+                if not en_cola[j] and etiquetas[j] != mejor:
+                    cola.append(j)
+                    en_cola[j] = True
+    return cambio
+
+def _refinar(indptr, indices, datos, k, etiquetas, m2, rng, resolucion):
+    '''Refinamiento de Leiden (variante voraz): subcomunidades bien conectadas dentro de cada comunidad.
+
+    Cada nodo que sigue solo y está bien conectado a su comunidad C se une a
+    la subcomunidad S de C bien conectada que más aumenta Q, o queda solo si
+    ninguna la aumenta. Así las comunidades agregadas nunca quedan partidas.
+    '''
+    n = len(k)
+    refinadas = list(range(n))
+    tamanio_K = list(k)
+    total_C = {}
+    for i in range(n):
+        total_C[etiquetas[i]] = total_C.get(etiquetas[i], 0) + k[i]
+    # Peso de cada subcomunidad hacia el resto de su comunidad
+    externo = [0.0] * n
+    for i in range(n):
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            if j != i and etiquetas[j] == etiquetas[i]:
+                externo[i] += datos[p]
+    solo = [True] * n
+    for i in rng.permutation(n).tolist():
+        C = etiquetas[i]
+        if not solo[i] or externo[i] < resolucion * k[i] * (total_C[C] - k[i]) / m2:
+            continue
+        pesos = {}
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            if j != i and etiquetas[j] == C:
+                pesos[refinadas[j]] = pesos.get(refinadas[j], 0) + datos[p]
+        factor = resolucion * k[i] / m2
+        mejor, ganancia = refinadas[i], 0.0
+        for S, w in pesos.items():
+            if externo[S] < resolucion * tamanio_K[S] * (total_C[C] - tamanio_K[S]) / m2:
+                continue
+            g = w - factor * tamanio_K[S]
+            if g > ganancia + 1e-12:
+                mejor, ganancia = S, g
+        if mejor != refinadas[i]:
+            w = pesos[mejor]
+            refinadas[i] = mejor
+            externo[mejor] += externo[i] - 2 * w
+            tamanio_K[mejor] += k[i]
+            solo[i] = solo[mejor] = False
+    return refinadas
+
+def _agregar(B, grupos):
+    '''Matriz de la red agregada: un nodo por grupo, B' = S^T B S.'''
+    _, grupos = np.unique(grupos, return_inverse=True)
+    S = sparse.csr_matrix((np.ones(len(grupos)), (np.arange(len(grupos)), grupos)))
+    return (S.T @ B @ S).tocsr(), grupos
+
+
+# -------------------------------
+# Louvain / Leiden
+# -------------------------------
+def niveles_louvain(B, semilla=None, leiden=False, resolucion=1):
+    '''Particiones de cada pasada como (etiquetas por nodo original, modularidad).
+
+    Cada pasada mueve nodos localmente, (con leiden) refina, y agrega cada
+    comunidad (o subcomunidad refinada) en un nodo; termina cuando una
+    pasada ya no junta nada. Los niveles salen en orden de agregación y la
+    modularidad no baja de uno al siguiente.
+    '''
+    rng = np.random.default_rng(semilla)
+    m2 = B.sum()
+    n = B.shape[0]
+    pertenencia = np.arange(n)
+    actual = B
+    iniciales = list(range(n))
+    niveles = []
+    while True:
+        indptr, indices, datos = actual.indptr.tolist(), actual.indices.tolist(), actual.data.tolist()
+        k = np.asarray(actual.sum(axis=1)).ravel().tolist()
+        etiquetas = list(iniciales)
+        _mover_nodos(indptr, indices, datos, k, etiquetas, m2, rng, resolucion)
+        _, comunidades = np.unique(etiquetas, return_inverse=True)
+        particion = comunidades[pertenencia]
+        if not niveles or len(np.unique(particion)) < len(np.unique(niveles[-1][0])):
+            niveles.append((particion, modularidad(B, particion, resolucion)))
+        grupos = _refinar(indptr, indices, datos, k, etiquetas, m2, rng, resolucion) if leiden else etiquetas
+        if len(set(grupos)) == actual.shape[0]:
+            return niveles
+        actual, grupos = _agregar(actual, grupos)
+        pertenencia = grupos[pertenencia]
+        # La red agregada arranca con la partición sin refinar
+        iniciales = np.zeros(actual.shape[0], dtype=int)
+        iniciales[grupos] = comunidades
+        iniciales = iniciales.tolist()
+
+
+# -------------------------------
+# Reinicios en paralelo
+# -------------------------------
+_compartido = {}
+
+def _iniciar_trabajador(B, opciones):
+    _compartido.update(B=B, opciones=opciones)
+
+def _reinicio(tarea):
+    r, semilla = tarea
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        return r, niveles_louvain(_compartido['B'], semilla, **_compartido['opciones'])
+
+def louvain_con_reinicios(G, reinicios=1, semilla=0, procesos=1, leiden=False, resolucion=1):
+    '''Corre `reinicios` veces con semillas independientes y se queda con la de mayor modularidad.
+
+    Devuelve (nodos, niveles del mejor reinicio, modularidad final de cada
+    reinicio). Con procesos > 1 los reinicios se reparten en un pool.
+    '''
+    nodos, B = matriz_de_modularidad(G)
+    semillas = np.random.SeedSequence(semilla).spawn(reinicios)
+    tareas = list(enumerate(semillas))
+    opciones = {'leiden': leiden, 'resolucion': resolucion}
+    procesos = min(procesos or os.cpu_count(), reinicios)
+    resultados = [None] * reinicios
+    if procesos > 1:
+        contexto = multiprocessing.get_context('fork')
+        with contexto.Pool(procesos, initializer=_iniciar_trabajador, initargs=(B, opciones)) as pool:
+            for r, niveles in pool.imap_unordered(_reinicio, tareas):
+                resultados[r] = niveles
+    else:
+        for r, s in tareas:
+            resultados[r] = niveles_louvain(B, s, **opciones)
+    finales = [niveles[-1][1] for niveles in resultados]
+    # Ante empates gana el primer reinicio, así el resultado no depende del orden de llegada
+    mejor = int(np.argmax(finales))
+    return nodos, resultados[mejor], finales
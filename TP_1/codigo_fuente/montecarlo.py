@@ -0,0 +1,167 @@
+"""Monte Carlo en paralelo para los ataques estocásticos (azar y curiosa)."""
+import contextlib
+import multiprocessing
+import os
+import warnings
+
+import numpy as np
+
+from percolacion import pasos_de_remocion
+from robustez import simular_robustez
+
+
+# -------------------------------
+# Órdenes de ataque con generador explícito
+# -------------------------------
+def orden_azar(G, rng):
+    '''Equivalente a random.shuffle(list(G.nodes())) con un np.random.Generator.'''
+    nodos = list(G.nodes())
+    return [nodos[i] for i in rng.permutation(len(nodos))]
+
+def orden_curiosa(G, centralidad_dict, rng):
+    '''Equivalente a estrategia_curiosa con un np.random.Generator.'''
+    valores = sorted(centralidad_dict.items(), key=lambda x: x[1])
+    nodos = [x[0] for x in valores]
+    pesos = np.linspace(1.0, 0.1, len(nodos))
+    pesos /= pesos.sum()
+    elegidos = rng.choice(len(nodos), size=len(nodos), replace=True, p=pesos)
+    return [nodos[i] for i in elegidos]
+
+ESTRATEGIAS = {
+    'azar': lambda G, centralidad, rng: orden_azar(G, rng),
+    'curiosa': orden_curiosa,
+}
+
+
+# -------------------------------
+# Trabajadores
+# -------------------------------
+_compartido = {}
+
+def _iniciar_trabajador(G, centralidad, carpeta, opciones):
+    # El grafo se envía una sola vez por proceso, no en cada tarea
+    _compartido.update(G=G, centralidad=centralidad, carpeta=carpeta, opciones=opciones)
+
+def _realizacion(tarea):
+    r, estrategia, semilla = tarea
+    rng = np.random.default_rng(semilla)
+    G = _compartido['G']
+    nodos = ESTRATEGIAS[estrategia](G, _compartido['centralidad'], rng)
+    opciones = dict(_compartido['opciones'])
+    if opciones.get('mode') == 'sampled':
+        opciones['semilla'] = rng.integers(2**32)
+    # Los mensajes de cada realización no se intercalan con los del padre
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        curvas = simular_robustez(G, nodos, diagnosticos=True, **opciones)
+    ngn, eff, percolacion = curvas[0], curvas[1], curvas[-1]
+    # Paso de cada nodo distinto eliminado: con curiosa los repetidos no sacan nada
+    nuevos = np.fromiter(pasos_de_remocion(G, nodos).values(), dtype=np.int64)
+
+    archivo = os.path.join(_compartido['carpeta'], f'realizacion_{r:04d}.npz')
+    np.savez_compressed(archivo, ngn=ngn, eff=eff, segunda=percolacion['segunda'],
+                        susceptibilidad=percolacion['susceptibilidad'],
+                        f_c=np.nan if percolacion['f_c'] is None else percolacion['f_c'],
+                        pasos_nuevos=nuevos, semilla=semilla.entropy, spawn_key=semilla.spawn_key)
+    return r, ngn, eff, percolacion, nuevos
+
+
+# -------------------------------
+# Agregación
+# -------------------------------
+def completar(curva, largo):
+    '''Rellena con 0 los pasos posteriores al corte de simular_robustez.'''
+    fila = np.zeros(largo)
+    fila[:len(curva)] = curva[:largo]
+    return fila
+
+def por_fraccion(curva, nuevos, largo):
+    '''Pasa una curva por paso a la grilla de nodos distintos removidos (k = 1..largo).
+
+    La posición k - 1 tiene el valor del paso en que se eliminó el k-ésimo
+    nodo distinto; las fracciones que la realización no alcanza quedan en NaN.
+    '''
+    fila = np.full(largo, np.nan)
+    if len(nuevos):
+        fila[:len(nuevos)] = completar(curva, nuevos[-1] + 1)[nuevos]
+    return fila
+
+def resumir(curvas, percentiles=(5, 25, 50, 75, 95)):
+    '''Media, desvío y percentiles por columna, ignorando los NaN.'''
+    curvas = np.asarray(curvas)
+    with warnings.catch_warnings():
+        # Columnas con una sola realización (o ninguna) dan NaN sin avisar
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return {
+            'media': np.nanmean(curvas, axis=0),
+            'std': np.nanstd(curvas, axis=0, ddof=1) if len(curvas) > 1 else np.zeros(curvas.shape[1]),
+            'percentiles': dict(zip(percentiles, np.nanpercentile(curvas, percentiles, axis=0))),
+        }
+
+def simular_montecarlo(G, estrategia, realizaciones, centralidad=None, semilla=0,
+                       procesos=None, carpeta='montecarlo', **opciones):
+    '''Corre `realizaciones` ataques estocásticos en un pool de procesos.
+
+    Cada realización r usa la semilla SeedSequence(semilla).spawn(...)[r],
+    así el resultado no depende de la cantidad de procesos ni del orden en
+    que terminan. Cada curva se guarda en carpeta/realizacion_rrrr.npz
+    apenas termina. Las opciones extra se pasan a simular_robustez.
+
+    Las curvas se agregan por fracción de nodos distintos removidos, no por
+    paso: con curiosa los sorteos son con reposición y un nodo repetido no
+    saca nada, así que cada realización se lleva primero a esa grilla
+    (ver por_fraccion). Con azar es lo mismo que por paso.
+
+    Devuelve un diccionario con 'fraccion' (k / N), 'cobertura' (cuántas
+    realizaciones llegaron a cada fracción) y, para 'ngn', 'eff', 'segunda'
+    y 'susceptibilidad', la media, el desvío y las bandas de percentiles
+    sobre las realizaciones que llegaron. 'f_c' tiene el umbral estimado de
+    cada realización (ver percolacion.diagnosticos_percolacion) junto con su
+    media y desvío.
+    '''
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"estrategia debe ser una de {sorted(ESTRATEGIAS)}, no {estrategia!r}")
+    if estrategia == 'curiosa' and centralidad is None:
+        raise ValueError("la estrategia curiosa necesita el diccionario de centralidad")
+    os.makedirs(carpeta, exist_ok=True)
+
+    n = G.number_of_nodes()
+    semillas = np.random.SeedSequence(semilla).spawn(realizaciones)
+    tareas = [(r, estrategia, semillas[r]) for r in range(realizaciones)]
+    ngn = np.full((realizaciones, n), np.nan)
+    eff = np.full((realizaciones, n), np.nan)
+    segunda = np.full((realizaciones, n), np.nan)
+    susceptibilidad = np.full((realizaciones, n), np.nan)
+    f_c = np.full(realizaciones, np.nan)
+
+    # Los scripts no tienen guarda __main__: con fork los hijos no los re-ejecutan
+    contexto = multiprocessing.get_context('fork')
+    procesos = procesos or os.cpu_count()
+    with contexto.Pool(procesos, initializer=_iniciar_trabajador,
+                       initargs=(G, centralidad, carpeta, opciones)) as pool:
+        for hechas, (r, curva_ngn, curva_eff, percolacion, nuevos) in enumerate(
+                pool.imap_unordered(_realizacion, tareas), start=1):
+            ngn[r] = por_fraccion(curva_ngn, nuevos, n)
+            eff[r] = por_fraccion(curva_eff, nuevos, n)
+            segunda[r] = por_fraccion(percolacion['segunda'], nuevos, n)
+            susceptibilidad[r] = por_fraccion(percolacion['susceptibilidad'], nuevos, n)
+            if percolacion['f_c'] is not None:
+                f_c[r] = percolacion['f_c']
+            print(f"🎲 Realización {hechas}/{realizaciones}")
+
+    # La grilla llega hasta la mayor fracción que alcanzó alguna realización
+    alcanzadas = (~np.isnan(ngn)).sum(axis=0)
+    largo = int(np.count_nonzero(alcanzadas))
+    ngn, eff = ngn[:, :largo], eff[:, :largo]
+    segunda, susceptibilidad = segunda[:, :largo], susceptibilidad[:, :largo]
+
+    return {
+        'fraccion': np.arange(1, largo + 1) / n,
+        'cobertura': alcanzadas[:largo],
+        'realizaciones': realizaciones,
+        'semilla': semilla,
+        'ngn': resumir(ngn),
+        'eff': resumir(eff),
+        'segunda': resumir(segunda),
+        'susceptibilidad': resumir(susceptibilidad),
+        'f_c': {'valores': f_c, 'media': np.nanmean(f_c), 'std': np.nanstd(f_c, ddof=1)},
+    }
@@ -0,0 +1,191 @@
+"""Motor de percolación inversa (Newman-Ziff) para la curva Ng/N de simular_robustez."""
+from collections import Counter
+
+import networkx as nx
+
+
+# -------------------------------
+# Conjuntos disjuntos
+# -------------------------------
+class UnionFind:
+    '''Conjuntos disjuntos con compresión de camino y unión por tamaño.'''
+
+    def __init__(self):
+        self.padre = {}
+        self.tamanio = {}
+
+    def __contains__(self, x):
+        return x in self.padre
+
+    def agregar(self, x):
+        self.padre[x] = x
+        self.tamanio[x] = 1
+
+    def buscar(self, x):
+        raiz = x
+        while self.padre[raiz] != raiz:
+            raiz = self.padre[raiz]
+        while self.padre[x] != raiz:
+            self.padre[x], x = raiz, self.padre[x]
+        return raiz
+
+    def unir(self, a, b):
+        '''Une los conjuntos de a y b y devuelve el tamaño del conjunto resultante.'''
+        ra, rb = self.buscar(a), self.buscar(b)
+        if ra == rb:
+            return self.tamanio[ra]
+        if self.tamanio[ra] < self.tamanio[rb]:
+            ra, rb = rb, ra
+        self.padre[rb] = ra
+        self.tamanio[ra] += self.tamanio[rb]
+        return self.tamanio[ra]
+
+
+# -------------------------------
+# Orden de remoción
+# -------------------------------
+def pasos_de_remocion(G, nodos_ordenados):
+    '''Paso en el que simular_robustez elimina cada nodo (la primera aparición en el orden).'''
+    paso = {}
+    for i, nodo in enumerate(nodos_ordenados):
+        if nodo in G and nodo not in paso:
+            paso[nodo] = i
+    return paso
+
+
+def estados_inversos(G, nodos_ordenados):
+    '''Recorre los estados de la remoción de atrás hacia adelante agregando nodos.
+
+    Para cada paso i (de len(nodos_ordenados) - 1 a 0) devuelve una tupla
+    (i, uf, estado) con el grafo que queda luego de aplicar la remoción del
+    paso i: los nodos nunca eliminados se agregan primero y cada nodo
+    eliminado se reincorpora al llegar a su paso. estado tiene 'gigante',
+    'presentes', 'aristas', 'tamanios' (tamaño de componente -> cantidad de
+    componentes de ese tamaño) y 'cuadrados' (suma de los tamaños al
+    cuadrado).
+    '''
+    n_pasos = len(nodos_ordenados)
+    paso = pasos_de_remocion(G, nodos_ordenados)
+    nodo_en_paso = [None] * n_pasos
+    for nodo, i in paso.items():
+        nodo_en_paso[i] = nodo
+
+    uf = UnionFind()
+    estado = {'gigante': 0, 'presentes': 0, 'aristas': 0, 'tamanios': Counter(), 'cuadrados': 0}
+    tamanios = estado['tamanios']
+
+    def agregar(nodo):
+        uf.agregar(nodo)
+        estado['presentes'] += 1
+        estado['gigante'] = max(estado['gigante'], 1)
+        estado['cuadrados'] += 1
+        tamanios[1] += 1
+        for vecino in G[nodo]:
+            if vecino in uf:
+                estado['aristas'] += 1
+                a, b = uf.tamanio[uf.buscar(nodo)], uf.tamanio[uf.buscar(vecino)]
+                unido = uf.unir(nodo, vecino)
+                if unido != a:
+                    for s in (a, b):
+                        tamanios[s] -= 1
+                        if not tamanios[s]:
+                            del tamanios[s]
+                    tamanios[unido] += 1
+                    estado['cuadrados'] += 2 * a * b
+                estado['gigante'] = max(estado['gigante'], unido)
+
+    for nodo in G:
+        if nodo not in paso:
+            agregar(nodo)
+
+    for i in range(n_pasos - 1, -1, -1):
+        yield i, uf, estado
+        if nodo_en_paso[i] is not None:
+            agregar(nodo_en_paso[i])
+
+
+# -------------------------------
+# Curva Ng/N
+# -------------------------------
+def segunda_componente(tamanios, gigante):
+    '''Tamaño de la segunda componente más grande a partir del conteo de tamaños.'''
+    if tamanios.get(gigante, 0) > 1:
+        return gigante
+    return max((s for s in tamanios if s != gigante), default=0)
+
+@nx.utils.not_implemented_for("directed")
+def diagnosticos_percolacion(G, nodos_ordenados):
+    '''Ng/N y diagnósticos de percolación en una sola pasada inversa.
+
+    Devuelve un diccionario con, para cada paso de simular_robustez:
+
+    - 'ngn': la curva Ng/N (ver curva_ngn).
+    - 'segunda': tamaño de la segunda componente sobre los nodos presentes.
+    - 'susceptibilidad': tamaño medio de las componentes finitas,
+      sum(s²) / sum(s) sin contar la gigante.
+
+    y 'f_c', la fracción de nodos distintos de G removidos hasta el pico de
+    la susceptibilidad, que estima el umbral crítico (los repetidos y los
+    que no están en G no cuentan). Las series se cortan igual que la curva
+    Ng/N: al quedar el grafo sin nodos o sin aristas agregan un 0.
+    '''
+    n_pasos = len(nodos_ordenados)
+    gigantes = [0] * n_pasos
+    segundas = [0] * n_pasos
+    finitas = [0] * n_pasos
+    presentes = [0] * n_pasos
+    aristas = [0] * n_pasos
+    for i, _, estado in estados_inversos(G, nodos_ordenados):
+        gigante = estado['gigante']
+        gigantes[i] = gigante
+        segundas[i] = segunda_componente(estado['tamanios'], gigante)
+        resto = estado['presentes'] - gigante
+        finitas[i] = (estado['cuadrados'] - gigante ** 2) / resto if resto else 0
+        presentes[i] = estado['presentes']
+        aristas[i] = estado['aristas']
+
+    resultado = {'ngn': [], 'segunda': [], 'susceptibilidad': []}
+    for i in range(n_pasos):
+        if presentes[i] == 0 or aristas[i] == 0:
+            for serie in resultado.values():
+                serie.append(0)
+            break
+        resultado['ngn'].append(gigantes[i] / presentes[i])
+        resultado['segunda'].append(segundas[i] / presentes[i])
+        resultado['susceptibilidad'].append(finitas[i])
+
+    susceptibilidad = resultado['susceptibilidad']
+    pico = max(range(len(susceptibilidad)), key=susceptibilidad.__getitem__, default=None)
+    n_nodos = G.number_of_nodes()
+    if pico is not None and n_nodos:
+        removidos = sum(1 for i in pasos_de_remocion(G, nodos_ordenados).values() if i <= pico)
+        resultado['f_c'] = removidos / n_nodos
+    else:
+        resultado['f_c'] = None
+    return resultado
+
+@nx.utils.not_implemented_for("directed")
+def curva_ngn(G, nodos_ordenados):
+    '''Curva Ng/N idéntica a la de simular_robustez en O(M·α(N)).
+
+    En lugar de recalcular las componentes conexas después de cada remoción,
+    reconstruye el grafo agregando los nodos en el orden inverso con un
+    UnionFind. Reproduce el corte del bucle original: al quedar el grafo sin
+    nodos o sin aristas agrega un 0 y termina.
+    '''
+    n_pasos = len(nodos_ordenados)
+    gigantes = [0] * n_pasos
+    presentes = [0] * n_pasos
+    aristas = [0] * n_pasos
+    for i, _, estado in estados_inversos(G, nodos_ordenados):
+        gigantes[i] = estado['gigante']
+        presentes[i] = estado['presentes']
+        aristas[i] = estado['aristas']
+
+    fraccion_ngn = []
+    for i in range(n_pasos):
+        if presentes[i] == 0 or aristas[i] == 0:
+            fraccion_ngn.append(0)
+            break
+        fraccion_ngn.append(gigantes[i] / presentes[i])
+    return fraccion_ngn
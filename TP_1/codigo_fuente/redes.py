@@ -0,0 +1,261 @@
+"""Carga y preparación de las redes de Facebook y de aeropuertos."""
+import hashlib
+import json
+import os
+import tempfile
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+
+
+# -------------------------------
+# Lista de aristas con caché binaria
+# -------------------------------
+def _sha256(filename):
+    h = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 20), b''):
+            h.update(bloque)
+    return h.hexdigest()
+
+def _escribir_atomico(archivo, escribir):
+    '''Escribe en un temporal propio y lo renombra, como cache.guardar_centralidad.
+
+    Cada escritor tiene su temporal (mkstemp), así dos scripts que arrancan
+    juntos nunca pisan el mismo archivo a medio escribir.
+    '''
+    carpeta = os.path.dirname(os.path.abspath(archivo))
+    fd, temporal = tempfile.mkstemp(dir=carpeta, prefix=os.path.basename(archivo) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            escribir(f)
+        os.replace(temporal, archivo)
+    except BaseException:
+        os.unlink(temporal)
+        raise
+
+def _texto_vigente(filename, meta):
+    '''(vigente, meta actual): vigente si el texto es el mismo que describe meta.
+
+    Con tamaño y mtime iguales no se lee el archivo; si cambió el mtime se
+    compara el SHA-256 del contenido.
+    '''
+    estado = os.stat(filename)
+    actual = {'tamanio': estado.st_size, 'mtime_ns': estado.st_mtime_ns}
+    if meta and all(meta.get(clave) == valor for clave, valor in actual.items()):
+        return True, dict(meta)
+    actual['sha256'] = _sha256(filename)
+    return meta.get('sha256') == actual['sha256'], actual
+
+def leer_aristas(filename):
+    '''Lista de aristas como arreglo de enteros, lo mismo que np.loadtxt(filename, dtype=int).
+
+    La primera vez se parsea el texto (np.loadtxt, que desde NumPy 1.23 es
+    el lector en C más rápido de los disponibles acá) y se deja al lado un
+    <archivo>.npy, más un <archivo>.npy.json con el tamaño, el mtime y el
+    SHA-256 del texto. Las siguientes veces se mapea el .npy en memoria
+    (solo lectura). Si cambió el mtime se recalcula el hash y solo se vuelve
+    a parsear si cambió el contenido.
+    '''
+    binario = filename + '.npy'
+    meta_archivo = binario + '.json'
+    meta = {}
+    if os.path.isfile(binario) and os.path.isfile(meta_archivo):
+        with open(meta_archivo) as f:
+            meta = json.load(f)
+    vigente, actual = _texto_vigente(filename, meta)
+    if vigente and actual == meta:
+        return np.load(binario, mmap_mode='r')
+    array = np.load(binario, mmap_mode='r') if vigente else np.loadtxt(filename, dtype=int, ndmin=2)
+    try:
+        if not vigente:
+            _escribir_atomico(binario, lambda f: np.save(f, array))
+        _escribir_atomico(meta_archivo, lambda f: f.write(json.dumps(actual).encode()))
+    except OSError:
+        # Sin permiso de escritura junto al archivo: se usa lo parseado sin caché
+        pass
+    return array
+
+
+# -------------------------------
+# Leer grafo desde archivo
+# -------------------------------
+def read_graph(filename):
+    G = nx.Graph()
+    array = leer_aristas(filename)
+    G.add_edges_from(array)
+    return G
+
+def verificar_archivo(file_path):
+    if not os.path.isfile(file_path):
+        raise FileNotFoundError(f"❌ El archivo '{file_path}' no se encontró.")
+
+
+# -------------------------------
+# Redes preparadas
+# -------------------------------
+def cargar_facebook(file_path='facebook.txt'):
+    '''Red de Facebook: no dirigida y sin pesos, tal como está en el archivo.'''
+    verificar_archivo(file_path)
+    return read_graph(file_path)
+
+def _primeras_apariciones(claves):
+    '''Índices de la primera aparición de cada clave distinta, en orden de aparición.'''
+    _, primeras = np.unique(claves, return_index=True)
+    return np.sort(primeras)
+
+def _gigante_de_networkx(n, u, v, etiquetas, tamanio):
+    '''Etiqueta de la primera componente de `tamanio` nodos que devuelve nx.strongly_connected_components.
+
+    Ese orden sale del recorrido de Tarjan (nodos y sucesores en orden de
+    inserción), así que se corre sobre un DiGraph sin pesos con los mismos
+    órdenes que el original. Solo hace falta cuando hay empate de tamaño.
+    '''
+    D = nx.DiGraph()
+    D.add_nodes_from(range(n))
+    D.add_edges_from(zip(u.tolist(), v.tolist()))
+    for componente in nx.strongly_connected_components(D):
+        if len(componente) == tamanio:
+            return etiquetas[next(iter(componente))]
+
+def preparar_aeropuertos(file_path):
+    '''airU como arreglos: nodos (ids originales) y aristas con ids reetiquetados 0..N-1.
+
+    Arma la proyección no dirigida y sin pesos de la componente gigante
+    fuertemente conexa directamente desde el arreglo de arcos, sin construir
+    el DiGraph con pesos ni sus copias (to_undirected, .copy() y el
+    borrado de pesos). Reproduce las elecciones y los órdenes de networkx:
+
+    - componente gigante: la más grande; si hay empate, la primera que
+      devuelve nx.strongly_connected_components (solo en ese caso se arma
+      un DiGraph sin pesos para preguntárselo).
+    - nodos: por primera aparición en el archivo, como los agrega el
+      DiGraph (y la vista de la componente, cuando tiene al menos la mitad
+      de los nodos; si no, networkx usaría el orden del set).
+    - arcos: los distintos, por su primera aparición, agrupados por origen
+      en el orden de los nodos, como los recorre to_undirected.
+    - aristas: por nodo, los vecinos en el orden en que to_undirected los
+      fue agregando, que es el orden en que .copy() las vuelve a insertar.
+
+    Así grafo_desde_arreglos da el mismo grafo que la cadena de networkx,
+    con el mismo orden de nodos y de vecinos. El informe de conectividad
+    sale de las mismas dos búsquedas de componentes (fuerte y débil).
+    '''
+    arreglo = leer_aristas(file_path)
+    pesado = arreglo.shape[1] > 2 and len(arreglo) > 0
+    extremos = np.asarray(arreglo[:, :2])
+    valores, primeras, codigos = np.unique(extremos.ravel(), return_index=True, return_inverse=True)
+    # Rango de cada nodo en el orden de primera aparición
+    rango = np.empty(len(valores), dtype=np.int64)
+    rango[np.argsort(primeras, kind='stable')] = np.arange(len(valores))
+    nodos_air = valores[np.argsort(primeras, kind='stable')]
+    n = len(nodos_air)
+    u, v = rango[codigos].reshape(-1, 2).T
+    # Un arco repetido solo actualiza el peso: cuenta su primera aparición
+    distintos = _primeras_apariciones(u * n + v)
+    u, v = u[distintos], v[distintos]
+
+    A = sparse.csr_matrix((np.ones(len(u), dtype=np.int8), (u, v)), shape=(n, n))
+    cantidad, etiquetas = csgraph.connected_components(A, directed=True, connection='strong')
+    debiles, _ = csgraph.connected_components(A, directed=True, connection='weak')
+    tamanios = np.bincount(etiquetas, minlength=cantidad)
+    empatadas = np.flatnonzero(tamanios == tamanios.max()) if n else [0]
+    gigante = empatadas[0]
+    if len(empatadas) > 1:
+        # sorted(..., key=len, reverse=True) deja primero a la que networkx devolvió primero
+        gigante = _gigante_de_networkx(n, u, v, etiquetas, tamanios.max())
+    adentro = etiquetas == gigante
+    nuevo = np.cumsum(adentro) - 1
+
+    en_gigante = adentro[u] & adentro[v]
+    u, v = nuevo[u[en_gigante]], nuevo[v[en_gigante]]
+    orden = np.argsort(u, kind='stable')
+    u, v = u[orden], v[orden]
+    # to_undirected: cada arco t agrega v a los vecinos de u y u a los de v
+    m = len(u)
+    x = np.concatenate([u, v])
+    y = np.concatenate([v, u])
+    t = np.concatenate([np.arange(m), np.arange(m)])
+    s = int(adentro.sum())
+    primeras = _primeras_apariciones(x * s + y)
+    x, y, t = x[primeras], y[primeras], t[primeras]
+    orden = np.lexsort((t, x))
+    x, y = x[orden], y[orden]
+    # .copy() recorre esos vecinos; cada arista se inserta desde su extremo de menor rango
+    quedan = y >= x
+    aristas = np.column_stack([x[quedan], y[quedan]]).astype(np.int32)
+    nodos = nodos_air[adentro].astype(np.int64)
+
+    informe = {
+        'air': {'nodos': n, 'aristas': len(distintos), 'dirigido': True, 'pesado': bool(pesado),
+                'fuertemente_conexo': bool(cantidad == 1), 'debilmente_conexo': bool(debiles == 1)},
+        # Una componente fuertemente conexa es, por definición, fuerte y débilmente conexa
+        'airStrongly': {'nodos': s, 'aristas': m, 'dirigido': True, 'pesado': bool(pesado and m > 0),
+                        'fuertemente_conexo': True, 'debilmente_conexo': True},
+        'airU': {'nodos': s, 'aristas': len(aristas), 'dirigido': False, 'pesado': False, 'conexo': True},
+    }
+    return nodos, aristas, informe
+
+def grafo_desde_arreglos(nodos, aristas):
+    G = nx.Graph()
+    G.add_nodes_from(nodos.tolist())
+    G.add_edges_from(nodos[aristas].tolist())
+    return G
+
+def aeropuertos_preparados(file_path='airport.txt'):
+    '''(nodos, aristas, informe) de airU, leídos de <archivo>.airU.npz o preparados y guardados ahí.
+
+    El .npz guarda también tamaño, mtime y SHA-256 del texto y se rehace
+    solo si cambió el contenido, igual que leer_aristas.
+    '''
+    verificar_archivo(file_path)
+    archivo = file_path + '.airU.npz'
+    meta = {}
+    if os.path.isfile(archivo):
+        with np.load(archivo) as datos:
+            guardado = {clave: datos[clave] for clave in datos.files}
+        meta = json.loads(str(guardado['meta']))
+    vigente, actual = _texto_vigente(file_path, meta)
+    if vigente:
+        nodos, aristas, informe = guardado['nodos'], guardado['aristas'], json.loads(str(guardado['informe']))
+    else:
+        nodos, aristas, informe = preparar_aeropuertos(file_path)
+    if actual != meta:
+        try:
+            _escribir_atomico(archivo, lambda f: np.savez(f, nodos=nodos, aristas=aristas,
+                                                          informe=json.dumps(informe), meta=json.dumps(actual)))
+        except OSError:
+            pass
+    return nodos, aristas, informe
+
+def cargar_aeropuertos(file_path='airport.txt', informe=False):
+    '''airU: componente gigante fuertemente conexa, no dirigida y sin pesos.
+
+    Se arma desde los arreglos de aeropuertos_preparados; con informe=True
+    devuelve también el informe de conectividad (ver imprimir_informe).
+    '''
+    nodos, aristas, datos = aeropuertos_preparados(file_path)
+    airU = grafo_desde_arreglos(nodos, aristas)
+    return (airU, datos) if informe else airU
+
+def imprimir_informe(informe):
+    '''Los mismos chequeos que imprimían los scripts de aeropuertos, sin recalcular nada.'''
+    titulos = {'air': 'Airport', 'airStrongly': 'Airport componente gigante fuertemente conexa',
+               'airU': 'C. air (unweighted)'}
+    preguntas = {'dirigido': 'Es dirigido?', 'pesado': 'Es pesado?', 'fuertemente_conexo': 'Es fuertemente conexo?',
+                 'debilmente_conexo': 'Es debilmente conexo?', 'conexo': 'Es conectado?'}
+    for clave, titulo in titulos.items():
+        propiedades = informe[clave]
+        print(titulo)
+        print(f"{propiedades['nodos']} nodos, {propiedades['aristas']} aristas")
+        for propiedad, pregunta in preguntas.items():
+            if propiedad in propiedades:
+                print(f"{pregunta}: {propiedades[propiedad]}")
+        print('')
+
+CARGADORES = {
+    'facebook': cargar_facebook,
+    'aeropuertos': cargar_aeropuertos,
+}
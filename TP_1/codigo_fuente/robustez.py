@@ -0,0 +1,302 @@
+"""Simulación de robustez compartida por los scripts simular_* y simulacion_*."""
+import networkx as nx
+import numpy as np
+
+from backend_csr import GrafoCSR
+from eficiencia import (EficienciaIncremental, EficienciaMuestreada, EficienciaPorComponentes,
+                        eficiencia_global_bitparalela, orden_de_pivotes)
+from percolacion import curva_ngn, diagnosticos_percolacion
+
+
+# -------------------------------
+# Métricas
+# -------------------------------
+def ng_n(G):
+    if nx.is_directed(G):
+        giant = max(nx.strongly_connected_components(G), key=len)
+    else:
+        giant = max(nx.connected_components(G), key=len)
+    return len(giant) / G.number_of_nodes()
+
+def global_efficiency(G):
+    try:
+        return nx.global_efficiency(G)
+    except:
+        return 0
+
+
+# -------------------------------
+# Simulación
+# -------------------------------
+def simular_robustez_referencia(G_original, nodos_ordenados, dirigido=False):
+    '''Versión original: recalcula Ng/N y eficiencia desde cero en cada paso.'''
+    G = G_original.copy()
+    fraccion_ngn = []
+    eficiencias = []
+    visitados = set()
+
+    for i, nodo in enumerate(nodos_ordenados):
+        if nodo in G and nodo not in visitados:
+            G.remove_node(nodo)
+            visitados.add(nodo)
+        if G.number_of_nodes() == 0 or G.number_of_edges() == 0:
+            fraccion_ngn.append(0)
+            eficiencias.append(0)
+            break
+        fraccion_ngn.append(ng_n(G))
+        eficiencias.append(global_efficiency(G))
+        if i % 100 == 0:
+            print(f"🧩 Iteración {i}/{len(nodos_ordenados)}")
+
+    return fraccion_ngn, eficiencias
+
+def colapsada(ngn, presentes, parada_ngn=None, parada_gigante=None):
+    '''Criterio de parada: Ng/N < parada_ngn o componente gigante <= parada_gigante nodos.'''
+    if parada_ngn is not None and ngn < parada_ngn:
+        return True
+    return parada_gigante is not None and round(ngn * presentes) <= parada_gigante
+
+def paso_de_colapso(fraccion_ngn, G, nodos_ordenados, parada_ngn=None, parada_gigante=None):
+    '''Primer paso en que se cumple colapsada (None si no se cumple nunca).'''
+    if parada_ngn is None and parada_gigante is None:
+        return None
+    presentes = G.number_of_nodes()
+    visitados = set()
+    for i, nodo in enumerate(nodos_ordenados[:len(fraccion_ngn)]):
+        if nodo in G and nodo not in visitados:
+            visitados.add(nodo)
+            presentes -= 1
+        if colapsada(fraccion_ngn[i], presentes, parada_ngn, parada_gigante):
+            return i
+    return None
+
+def simular_robustez_csr(grafo, nodos_ordenados, lote=256, parada_ngn=None, parada_gigante=None):
+    '''Mismo bucle que simular_robustez_referencia sobre un GrafoCSR.
+
+    Las componentes conexas y los BFS de la eficiencia se calculan con
+    scipy.sparse.csgraph sobre la submatriz de los nodos activos. Una vez
+    que se cumple el criterio de parada (ver colapsada) ambas métricas
+    siguen con EficienciaPorComponentes.
+    '''
+    fraccion_ngn = []
+    eficiencias = []
+    cola = None
+
+    for i, nodo in enumerate(nodos_ordenados):
+        if nodo in grafo:
+            grafo.eliminar(nodo)
+            if cola is not None:
+                cola.eliminar(nodo)
+        if grafo.number_of_nodes() == 0 or grafo.number_of_edges() == 0:
+            fraccion_ngn.append(0)
+            eficiencias.append(0)
+            break
+        if cola is not None:
+            fraccion_ngn.append(cola.gigante() / grafo.number_of_nodes())
+            eficiencias.append(cola.valor())
+            continue
+        fraccion_ngn.append(grafo.ng_n())
+        eficiencias.append(grafo.eficiencia(lote))
+        if colapsada(fraccion_ngn[-1], grafo.number_of_nodes(), parada_ngn, parada_gigante):
+            print(f"🧊 Red colapsada en la iteración {i}: se sigue solo con las componentes chicas")
+            cola = EficienciaPorComponentes(grafo)
+        if i % 100 == 0:
+            print(f"🧩 Iteración {i}/{len(nodos_ordenados)}")
+
+    return fraccion_ngn, eficiencias
+
+def pasos_a_evaluar(fraccion_ngn, n_nodos, stride, umbral_refinamiento):
+    '''Pasos de la grilla de fracciones más los tramos donde Ng/N cae bruscamente.
+
+    El paso i corresponde a la fracción (i + 1) / n_nodos. Entre dos puntos
+    consecutivos de la grilla cuya diferencia de Ng/N supera
+    umbral_refinamiento se evalúan todos los pasos intermedios.
+    '''
+    ultimo = len(fraccion_ngn) - 1
+    salto = max(1, int(round(stride * n_nodos)))
+    grilla = list(range(0, ultimo, salto)) + [ultimo]
+    pasos = set(grilla)
+    for a, b in zip(grilla, grilla[1:]):
+        if abs(fraccion_ngn[b] - fraccion_ngn[a]) > umbral_refinamiento:
+            pasos.update(range(a + 1, b))
+    return sorted(pasos)
+
+def simular_robustez_por_fracciones(G_original, nodos_ordenados, stride=0.005,
+                                    umbral_refinamiento=0.01, mode="exact",
+                                    pivotes=64, semilla=None, parada_ngn=None,
+                                    parada_gigante=None, fraccion_ngn=None):
+    '''Curvas de robustez evaluando la eficiencia solo en los pasos de pasos_a_evaluar.
+
+    Ng/N sale completa de la percolación inversa. La eficiencia se calcula
+    desde cero en cada paso elegido (eficiencia_global_bitparalela, GrafoCSR.eficiencia
+    o EficienciaMuestreada con el orden de pivotes del grafo original) y
+    se interpola linealmente en el resto, así las listas tienen el mismo
+    largo que las de simular_robustez. Desde el paso de colapso (ver
+    paso_de_colapso) se evalúan todos los pasos con EficienciaPorComponentes.
+    Si ya se tiene la curva Ng/N se puede pasar en fraccion_ngn.
+    '''
+    if fraccion_ngn is None:
+        fraccion_ngn = curva_ngn(G_original, nodos_ordenados)
+    if not fraccion_ngn:
+        return (fraccion_ngn, [], []) if mode == "sampled" else (fraccion_ngn, [])
+    csr = isinstance(G_original, GrafoCSR)
+    n_nodos = G_original.number_of_nodes()
+    pasos = pasos_a_evaluar(fraccion_ngn, n_nodos, stride, umbral_refinamiento)
+    colapso = paso_de_colapso(fraccion_ngn, G_original, nodos_ordenados, parada_ngn, parada_gigante)
+    if colapso is not None:
+        pasos = sorted(set(pasos) | set(range(colapso, len(fraccion_ngn))))
+    print(f"📏 Evaluando eficiencia en {len(pasos)} de {len(fraccion_ngn)} pasos")
+
+    G = GrafoCSR(G_original.nodos, G_original.A) if csr else G_original.copy()
+    orden = orden_de_pivotes(G_original, semilla) if mode == "sampled" else None
+    evaluar = set(pasos)
+    valores = []
+    errores = []
+    visitados = set()
+    cola = None
+
+    for i, nodo in enumerate(nodos_ordenados[:len(fraccion_ngn)]):
+        if nodo in G and nodo not in visitados:
+            if csr:
+                G.eliminar(nodo)
+            else:
+                G.remove_node(nodo)
+            if cola is not None:
+                cola.eliminar(nodo)
+            visitados.add(nodo)
+        if i == colapso:
+            cola = EficienciaPorComponentes(G)
+        if i not in evaluar:
+            continue
+        if G.number_of_nodes() == 0 or G.number_of_edges() == 0:
+            valores.append(0)
+            errores.append(0)
+        elif cola is not None:
+            valores.append(cola.valor())
+            errores.append(0)
+        elif mode == "sampled":
+            valor, error = EficienciaMuestreada(G, pivotes=pivotes, orden=orden).valor()
+            valores.append(valor)
+            errores.append(error)
+        else:
+            valores.append(G.eficiencia() if csr else eficiencia_global_bitparalela(G))
+        if i % 100 == 0:
+            print(f"🧩 Iteración {i}/{len(nodos_ordenados)}")
+
+    todos = np.arange(len(fraccion_ngn))
+    eficiencias = np.interp(todos, pasos, valores).tolist()
+    if mode == "sampled":
+        return fraccion_ngn, eficiencias, np.interp(todos, pasos, errores).tolist()
+    return fraccion_ngn, eficiencias
+
+def simular_robustez(G_original, nodos_ordenados, dirigido=False, mode="exact",
+                     pivotes=64, semilla=None, backend="networkx", stride=None,
+                     umbral_refinamiento=0.01, parada_ngn=None, parada_gigante=None,
+                     diagnosticos=False):
+    '''Curvas Ng/N y eficiencia global al eliminar los nodos en el orden dado.
+
+    Con backend="networkx" (la referencia), Ng/N se obtiene con percolación
+    inversa (ver percolacion.curva_ngn) y la eficiencia depende de mode:
+
+    - "exact": se actualiza en cada remoción con EficienciaIncremental, que
+      solo repite los BFS afectados por el nodo eliminado.
+    - "sampled": se estima con EficienciaMuestreada a partir de `pivotes`
+      fuentes BFS (comunes a todos los pasos, elegidas con `semilla`). En
+      este modo se devuelve además el error estándar de cada paso.
+
+    Con backend="csr" ambas métricas se calculan con scipy.sparse.csgraph
+    sobre un GrafoCSR (G_original puede ser un nx.Graph o un GrafoCSR ya
+    armado con GrafoCSR.desde_aristas); solo admite mode="exact".
+
+    Con stride (por ejemplo 0.005) la eficiencia se evalúa solo en una
+    grilla de fracciones removidas, refinada paso a paso donde Ng/N cae más
+    que umbral_refinamiento (ver simular_robustez_por_fracciones).
+
+    Con parada_ngn (Ng/N < parada_ngn) o parada_gigante (componente más
+    grande <= parada_gigante nodos), una vez colapsada la red se deja de
+    evaluar sobre el grafo completo y la cola de las curvas se completa con
+    EficienciaPorComponentes, que solo recorre las componentes chicas que
+    quedan. Las curvas mantienen su largo y la cola es exacta (error 0 en
+    mode="sampled").
+
+    Con diagnosticos=True se agrega al final de la tupla el diccionario de
+    percolacion.diagnosticos_percolacion (segunda componente,
+    susceptibilidad y f_c), que sale de la misma pasada que Ng/N. Solo para
+    grafos no dirigidos.
+    '''
+    if mode not in ("exact", "sampled"):
+        raise ValueError(f"mode debe ser 'exact' o 'sampled', no {mode!r}")
+    if backend not in ("networkx", "csr"):
+        raise ValueError(f"backend debe ser 'networkx' o 'csr', no {backend!r}")
+
+    if backend == "csr":
+        if mode == "sampled":
+            raise ValueError("mode='sampled' solo está disponible con backend='networkx'")
+        if isinstance(G_original, GrafoCSR):
+            G_original = GrafoCSR(G_original.nodos, G_original.A)
+        else:
+            G_original = GrafoCSR.desde_networkx(G_original)
+
+    percolacion = diagnosticos_percolacion(G_original, nodos_ordenados) if diagnosticos else None
+    if stride is not None:
+        curvas = simular_robustez_por_fracciones(
+            G_original, nodos_ordenados, stride, umbral_refinamiento, mode, pivotes, semilla,
+            parada_ngn, parada_gigante, percolacion['ngn'] if percolacion else None)
+    elif backend == "csr":
+        curvas = simular_robustez_csr(G_original, nodos_ordenados, parada_ngn=parada_ngn,
+                                      parada_gigante=parada_gigante)
+    elif nx.is_directed(G_original):
+        if mode == "sampled":
+            raise nx.NetworkXNotImplemented("mode='sampled' no admite grafos dirigidos")
+        curvas = simular_robustez_referencia(G_original, nodos_ordenados, dirigido)
+    else:
+        curvas = _simular_robustez_incremental(G_original, nodos_ordenados, mode, pivotes, semilla,
+                                               parada_ngn, parada_gigante, percolacion)
+    if diagnosticos:
+        return tuple(curvas) + (percolacion,)
+    return curvas
+
+def _simular_robustez_incremental(G_original, nodos_ordenados, mode, pivotes, semilla,
+                                  parada_ngn, parada_gigante, percolacion=None):
+    if percolacion is not None:
+        fraccion_ngn = percolacion['ngn']
+    else:
+        fraccion_ngn = curva_ngn(G_original, nodos_ordenados)
+    colapso = paso_de_colapso(fraccion_ngn, G_original, nodos_ordenados, parada_ngn, parada_gigante)
+
+    G = G_original.copy()
+    if mode == "sampled":
+        eficiencia = EficienciaMuestreada(G, pivotes=pivotes, semilla=semilla)
+    else:
+        eficiencia = EficienciaIncremental(G)
+    eficiencias = []
+    errores = []
+    visitados = set()
+
+    for i, nodo in enumerate(nodos_ordenados):
+        if nodo in G and nodo not in visitados:
+            G.remove_node(nodo)
+            eficiencia.eliminar(nodo)
+            visitados.add(nodo)
+        if i == colapso:
+            print(f"🧊 Red colapsada en la iteración {i}: se sigue solo con las componentes chicas")
+            eficiencia = EficienciaPorComponentes(G)
+        if G.number_of_nodes() == 0 or G.number_of_edges() == 0:
+            eficiencias.append(0)
+            errores.append(0)
+            break
+        if colapso is not None and i >= colapso:
+            eficiencias.append(eficiencia.valor())
+            errores.append(0)
+        elif mode == "sampled":
+            valor, error = eficiencia.valor()
+            eficiencias.append(valor)
+            errores.append(error)
+        else:
+            eficiencias.append(eficiencia.valor())
+        if i % 100 == 0:
+            print(f"🧩 Iteración {i}/{len(nodos_ordenados)}")
+
+    if mode == "sampled":
+        return fraccion_ngn, eficiencias, errores
+    return fraccion_ngn, eficiencias
@@ -1,12 +1,15 @@
-import pandas as pd
 import networkx as nx
-import numpy as np
 import pickle
-import random
 import os
-import datetime
+from ataques import ordenar_nodos
+from cache import centralidad_cacheada
+from robustez import simular_robustez
+from redes import leer_aristas
 """Script para ejecutar Girvan-Newman sobre un grafo y guardar la mejor partición + evolución en CSV (sin gráfico)."""
 
+# 'estatico': centralidad inicial; 'adaptativo': se recalcula tras cada remoción
+modo_ataque = 'estatico'
+
 print("Script iniciado correctamente...")
 print("Verificando existencia del archivo 'facebook.txt'...")
 
@@ -15,7 +18,7 @@ print("Verificando existencia del archivo 'facebook.txt'...")
 # -------------------------------
 def read_graph(filename):
     G = nx.Graph()
-    array = np.loadtxt(filename, dtype=int)
+    array = leer_aristas(filename)
     G.add_edges_from(array)
     return G
 
@@ -31,61 +34,21 @@ print(f"Grafo cargado: {fb.number_of_nodes()} nodos, {fb.number_of_edges()} aris
 
 print("🚀 Iniciando simulación: Facebook - Estrategia Tradicional")
 
-base_path = '/home/economatica/MCD-DM/'
-
-print("📥 Cargando centralidad de grado de Facebook...")
-grado_fb = pd.read_csv(base_path + 'centralidad_grado_facebook.csv', index_col=0)
-centralidad_fb = grado_fb['Centralidad_Grado'].to_dict()
-
-
-def ng_n(G):
-    if nx.is_directed(G):
-        giant = max(nx.strongly_connected_components(G), key=len)
-    else:
-        giant = max(nx.connected_components(G), key=len)
-    return len(giant) / G.number_of_nodes()
-
-def global_efficiency(G):
-    try:
-        return nx.global_efficiency(G)
-    except:
-        return 0
-
-def estrategia_tradicional(G, centralidad_dict):
-    return [n for n, _ in sorted(centralidad_dict.items(), key=lambda x: x[1], reverse=True)]
-
-def simular_robustez(G_original, nodos_ordenados, dirigido=False):
-    G = G_original.copy()
-    fraccion_ngn = []
-    eficiencias = []
-    visitados = set()
-
-    for i, nodo in enumerate(nodos_ordenados):
-        if nodo in G and nodo not in visitados:
-            G.remove_node(nodo)
-            visitados.add(nodo)
-        if G.number_of_nodes() == 0 or G.number_of_edges() == 0:
-            fraccion_ngn.append(0)
-            eficiencias.append(0)
-            break
-        fraccion_ngn.append(ng_n(G))
-        eficiencias.append(global_efficiency(G))
-        if i % 100 == 0:
-            print(f"🧩 Iteración {i}/{len(nodos_ordenados)}")
+print("📥 Calculando centralidad de grado de Facebook (o leyéndola de la caché)...")
+centralidad_fb = centralidad_cacheada(fb, 'grado')
 
-    return fraccion_ngn, eficiencias
 
 print("📊 Calculando orden de nodos con estrategia tradicional...")
-nodos = estrategia_tradicional(fb, centralidad_fb)
+nodos = ordenar_nodos(fb, centralidad_fb, 'grado', modo=modo_ataque)
 
 print("⚙️ Simulando robustez (Ng/N y eficiencia)...")
-fb_ngn_trad, fb_eff_trad = simular_robustez(fb, nodos, dirigido=False)
+fb_ngn_trad, fb_eff_trad, fb_perc_trad = simular_robustez(fb, nodos, dirigido=False, diagnosticos=True)
 
 output_path = os.path.dirname(os.path.abspath(__file__))
 output_file = os.path.join(output_path, 'fb_tradicional.pkl')
 
 print(f"💾 Guardando resultados en '{output_file}'...")
 with open(output_file, 'wb') as f:
-    pickle.dump({'ngn': fb_ngn_trad, 'eff': fb_eff_trad}, f)
+    pickle.dump({'ngn': fb_ngn_trad, 'eff': fb_eff_trad, 'percolacion': fb_perc_trad}, f)
 
 print("✅ Simulación completada: Facebook - Tradicional")
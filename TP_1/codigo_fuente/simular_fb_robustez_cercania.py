@@ -1,9 +1,13 @@
-import pandas as pd
 import networkx as nx
-import numpy as np
 import pickle
 import os
-from networkx.algorithms.efficiency_measures import global_efficiency
+from ataques import ordenar_nodos
+from cache import centralidad_cacheada
+from robustez import simular_robustez
+from redes import leer_aristas
+
+# 'estatico': centralidad inicial; 'adaptativo': se recalcula tras cada remoción
+modo_ataque = 'estatico'
 
 print("📡 Script iniciado: Facebook - Cercanía")
 
@@ -20,7 +24,7 @@ print("📁 Archivo encontrado.")
 # -------------------------------
 print("📥 Cargando grafo...")
 fb = nx.Graph()
-array = np.loadtxt(file_path, dtype=int)
+array = leer_aristas(file_path)
 fb.add_edges_from(array)
 
 print(f"Grafo cargado: {fb.number_of_nodes()} nodos, {fb.number_of_edges()} aristas.")
@@ -31,43 +35,14 @@ print(f"Es conectado?: {nx.is_connected(fb)}")
 # Calcular centralidad de cercanía
 # -------------------------------
 print("📊 Calculando centralidad de cercanía...")
-centralidad_fb = nx.closeness_centrality(fb)
-
-# -------------------------------
-# Funciones de simulación
-# -------------------------------
-def ng_n(G):
-    giant = max(nx.connected_components(G), key=len)
-    return len(giant) / G.number_of_nodes()
-
-def estrategia_tradicional(G, centralidad_dict):
-    return [n for n, _ in sorted(centralidad_dict.items(), key=lambda x: x[1], reverse=True)]
-
-def simular_robustez(G_original, nodos_ordenados):
-    G = G_original.copy()
-    fraccion_ngn = []
-    eficiencias = []
-    visitados = set()
-    for i, nodo in enumerate(nodos_ordenados):
-        if nodo in G and nodo not in visitados:
-            G.remove_node(nodo)
-            visitados.add(nodo)
-        if G.number_of_nodes() == 0 or G.number_of_edges() == 0:
-            fraccion_ngn.append(0)
-            eficiencias.append(0)
-            break
-        fraccion_ngn.append(ng_n(G))
-        eficiencias.append(global_efficiency(G))
-        if i % 100 == 0:
-            print(f"🧩 Iteración {i}/{len(nodos_ordenados)}")
-    return fraccion_ngn, eficiencias
+centralidad_fb = centralidad_cacheada(fb, 'cercania')
 
 # -------------------------------
 # Simulación
 # -------------------------------
 print("🚀 Iniciando simulación de robustez con cercanía...")
-nodos = estrategia_tradicional(fb, centralidad_fb)
-fb_ngn_cercania, fb_eff_cercania = simular_robustez(fb, nodos)
+nodos = ordenar_nodos(fb, centralidad_fb, 'cercania', modo=modo_ataque)
+fb_ngn_cercania, fb_eff_cercania, fb_perc_cercania = simular_robustez(fb, nodos, diagnosticos=True)
 
 # -------------------------------
 # Guardar resultados
@@ -77,6 +52,6 @@ output_file = os.path.join(output_path, 'fb_cercania.pkl')
 
 print(f"💾 Guardando resultados en '{output_file}'...")
 with open(output_file, 'wb') as f:
-    pickle.dump({'ngn': fb_ngn_cercania, 'eff': fb_eff_cercania}, f)
+    pickle.dump({'ngn': fb_ngn_cercania, 'eff': fb_eff_cercania, 'percolacion': fb_perc_cercania}, f)
 
 print("✅ Simulación completada: Facebook - Cercanía")
@@ -1,9 +1,13 @@
-import pandas as pd
 import networkx as nx
-import numpy as np
 import pickle
 import os
-from networkx.algorithms.efficiency_measures import global_efficiency
+from ataques import ordenar_nodos
+from cache import centralidad_cacheada
+from robustez import simular_robustez
+from redes import leer_aristas
+
+# 'estatico': centralidad inicial; 'adaptativo': se recalcula tras cada remoción
+modo_ataque = 'estatico'
 
 print("📡 Script iniciado: Facebook - Eigenvectores")
 
@@ -20,7 +24,7 @@ print("📁 Archivo encontrado.")
 # -------------------------------
 print("📥 Cargando grafo...")
 fb = nx.Graph()
-array = np.loadtxt(file_path, dtype=int)
+array = leer_aristas(file_path)
 fb.add_edges_from(array)
 
 print(f"Grafo cargado: {fb.number_of_nodes()} nodos, {fb.number_of_edges()} aristas.")
@@ -32,46 +36,17 @@ print(f"Es conectado?: {nx.is_connected(fb)}")
 # -------------------------------
 print("📊 Calculando centralidad de eigenvectores...")
 try:
-    centralidad_fb = nx.eigenvector_centrality(fb, max_iter=1000)
+    centralidad_fb = centralidad_cacheada(fb, 'eigenvector')
 except nx.PowerIterationFailedConvergence:
     print("⚠️ Error: no convergió el cálculo de eigenvector. Reintentá con max_iter mayor.")
     exit()
 
-# -------------------------------
-# Funciones de simulación
-# -------------------------------
-def ng_n(G):
-    giant = max(nx.connected_components(G), key=len)
-    return len(giant) / G.number_of_nodes()
-
-def estrategia_tradicional(G, centralidad_dict):
-    return [n for n, _ in sorted(centralidad_dict.items(), key=lambda x: x[1], reverse=True)]
-
-def simular_robustez(G_original, nodos_ordenados):
-    G = G_original.copy()
-    fraccion_ngn = []
-    eficiencias = []
-    visitados = set()
-    for i, nodo in enumerate(nodos_ordenados):
-        if nodo in G and nodo not in visitados:
-            G.remove_node(nodo)
-            visitados.add(nodo)
-        if G.number_of_nodes() == 0 or G.number_of_edges() == 0:
-            fraccion_ngn.append(0)
-            eficiencias.append(0)
-            break
-        fraccion_ngn.append(ng_n(G))
-        eficiencias.append(global_efficiency(G))
-        if i % 100 == 0:
-            print(f"🧩 Iteración {i}/{len(nodos_ordenados)}")
-    return fraccion_ngn, eficiencias
-
 # -------------------------------
 # Simulación
 # -------------------------------
 print("🚀 Iniciando simulación de robustez con eigenvectores...")
-nodos = estrategia_tradicional(fb, centralidad_fb)
-fb_ngn_eigen, fb_eff_eigen = simular_robustez(fb, nodos)
+nodos = ordenar_nodos(fb, centralidad_fb, 'eigenvector', modo=modo_ataque)
+fb_ngn_eigen, fb_eff_eigen, fb_perc_eigen = simular_robustez(fb, nodos, diagnosticos=True)
 
 # -------------------------------
 # Guardar resultados
@@ -81,6 +56,6 @@ output_file = os.path.join(output_path, 'fb_eigenvector.pkl')
 
 print(f"💾 Guardando resultados en '{output_file}'...")
 with open(output_file, 'wb') as f:
-    pickle.dump({'ngn': fb_ngn_eigen, 'eff': fb_eff_eigen}, f)
+    pickle.dump({'ngn': fb_ngn_eigen, 'eff': fb_eff_eigen, 'percolacion': fb_perc_eigen}, f)
 
 print("✅ Simulación completada: Facebook - Eigenvectores")
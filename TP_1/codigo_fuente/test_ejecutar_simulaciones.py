@@ -0,0 +1,29 @@
+"""Estrategias del barrido en modo adaptativo."""
+import pickle
+
+import networkx as nx
+import pytest
+
+from ataques import calcular_centralidad, ordenar_nodos
+from ejecutar_simulaciones import ESTRATEGIAS, correr
+
+
+@pytest.fixture
+def grafo():
+    return nx.barabasi_albert_graph(60, 2, seed=1)
+
+def test_intermediacion_aproximada_adaptativa_ordena_todos_los_nodos(grafo):
+    centralidad = calcular_centralidad(grafo, 'intermediacion_aproximada')
+    orden = ordenar_nodos(grafo, centralidad, 'intermediacion_aproximada', modo='adaptativo')
+    assert sorted(orden) == sorted(grafo)
+    assert orden == ordenar_nodos(grafo, centralidad, 'intermediacion_aproximada', modo='adaptativo')
+
+@pytest.mark.parametrize('estrategia', sorted(e for e in ESTRATEGIAS if e not in ('azar', 'curiosa')))
+def test_correr_en_modo_adaptativo(grafo, estrategia, tmp_path):
+    medida = ESTRATEGIAS[estrategia][0]
+    centralidades = {'red': {medida: calcular_centralidad(grafo, medida)}}
+    config = {'salida': str(tmp_path), 'modo_ataque': 'adaptativo', 'opciones': {}}
+    salida = correr('red', estrategia, {'red': grafo}, centralidades, config)
+    with open(salida, 'rb') as f:
+        datos = pickle.load(f)
+    assert 0 < len(datos['ngn']) <= grafo.number_of_nodes()